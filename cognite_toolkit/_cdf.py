@@ -5,7 +5,6 @@ import re
 import sys
 import traceback
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import NoReturn
 
 import typer
@@ -32,7 +31,6 @@ from cognite_toolkit._cdf_tk.apps import (
     RepoApp,
     RunApp,
 )
-from cognite_toolkit._cdf_tk.cdf_toml import CDFToml
 from cognite_toolkit._cdf_tk.commands import (
     CollectCommand,
 )
@@ -61,8 +59,6 @@ if USE_SENTRY:
     )
 
 
-CDF_TOML = CDFToml.load(Path.cwd())
-
 default_typer_kws = dict(
     pretty_exceptions_short=False,
     pretty_exceptions_show_locals=False,
@@ -3,7 +3,11 @@ from __future__ import annotations
 import abc
 import importlib
 import inspect
+import re
 import typing
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from types import CodeType
 from typing import Any, get_type_hints
 
 from cognite.client.data_classes import TransformationScheduleWrite
@@ -15,6 +19,19 @@ from cognite.client.data_classes.data_modeling.instances import (
     TypedNodeApply,
 )
 
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
+# Generic types that Python 3.10 fails to evaluate, and thus are resolved manually.
+_GENERIC_BY_NAME: dict[str, Any] = {
+    "Sequence": typing.Sequence,
+}
+
+
+@cache
+def _compile_annotation(annotation: str) -> CodeType:
+    # Compiling is the expensive part of eval, and the same annotation strings are used in many modules.
+    return compile(annotation, "<annotation>", "eval")
+
 
 class _TypeHints:
     """
@@ -26,9 +43,11 @@ class _TypeHints:
     _error_msg: typing.ClassVar[str] = "Please extend this function to support generating fake data for this type"
 
     @classmethod
-    def get_concrete_classes(cls, resource_cls: type) -> list[type]:
+    @cache
+    def get_concrete_classes(cls, resource_cls: type) -> tuple[type, ...]:
         """Returns all the concrete classes that are subclasses of the given class.
         (including the class itself if it is concrete)"""
+        # The subclass tree is stable once all the data classes are imported.
         concrete_classes = []
         to_check = [resource_cls]
         while to_check:
@@ -38,7 +57,7 @@ class _TypeHints:
                 continue
 
             to_check.extend(cls_.__subclasses__())
-            is_base_class = inspect.isclass(cls_) and any(base is abc.ABC for base in cls_.__bases__)
+            is_base_class = abc.ABC in cls_.__bases__
             # UnknownAcl is a special case, it is concrete class, but cannot be instantiated easily
             if not is_base_class and cls_ is not UnknownAcl:
                 concrete_classes.append(cls_)
@@ -46,7 +65,7 @@ class _TypeHints:
                 # TransformationScheduleWrite is wrongly marked as ABC, but it is a concrete class
                 # Fixed after 7.43.1
                 concrete_classes.append(cls_)
-        return concrete_classes
+        return tuple(concrete_classes)
 
     @classmethod
     def get_type_hints_by_name(cls, resource_cls: type | list[type]) -> dict[str, Any]:
@@ -58,21 +77,36 @@ class _TypeHints:
             resource_cls: The resource class to get type hints from.
         """
         if isinstance(resource_cls, list):
-            return {name: hint for cls_ in resource_cls for name, hint in cls.get_type_hints_by_name(cls_).items()}
-        if not hasattr(resource_cls, "__init__"):
+            return {name: hint for cls_ in resource_cls for name, hint in cls._get_type_hints_single(cls_).items()}
+        return cls._get_type_hints_single(resource_cls)
+
+    @classmethod
+    @cache
+    def _get_type_hints_single(cls, resource_cls: type) -> dict[str, Any]:
+        # The annotations of a class do not change at runtime, so the (expensive) evaluation
+        # of the type hints is only done once per class.
+        if resource_cls.__init__ is object.__init__:  # type: ignore[misc]
+            # Only the inherited object.__init__, which has no parameters to get type hints for.
             return {}
         try:
             type_hint_by_name = get_type_hints(resource_cls.__init__, localns=cls._type_checking())  # type: ignore[misc]
         except (TypeError, NameError):
             # Python 3.10 Type hints cannot be evaluated with get_type_hints,
             # ref https://stackoverflow.com/questions/66006087/how-to-use-typing-get-type-hints-with-pep585-in-python3-8
-            resource_module_vars = vars(importlib.import_module(resource_cls.__module__))
-            resource_module_vars.update(cls._type_checking())
             signature = inspect.signature(resource_cls.__init__)  # type: ignore[misc]
-            type_hint_by_name = cls._get_type_hints_3_10(resource_module_vars, signature, dict(vars(resource_cls)))
+            type_hint_by_name = cls._get_type_hints_3_10(resource_cls.__module__, signature, vars(resource_cls))
         return type_hint_by_name
 
     @classmethod
+    @cache
+    def _get_module_namespace(cls, module_name: str) -> dict[str, Any]:
+        # The type checking names are merged into a new namespace, such that the cached _type_checking
+        # output is shared, and the module namespace is not mutated. Many classes share the same module,
+        # so the merged namespace is only built once per module.
+        return {**vars(importlib.import_module(module_name)), **cls._type_checking()}
+
+    @classmethod
+    @lru_cache(maxsize=1)
     def _type_checking(cls) -> dict[str, type]:
         """
         When calling the get_type_hints function, it imports the module with the function TYPE_CHECKING is set to False.
@@ -100,26 +134,54 @@ class _TypeHints:
 
     @classmethod
     def _get_type_hints_3_10(
-        cls, resource_module_vars: dict[str, Any], signature310: inspect.Signature, local_vars: dict[str, Any]
+        cls, module_name: str, signature310: inspect.Signature, local_vars: Mapping[str, Any]
     ) -> dict[str, Any]:
+        annotation_by_name = {
+            name: parameter.annotation for name, parameter in signature310.parameters.items() if name != "self"
+        }
+        # Names defined in the class body, for example, Action in the Capability classes, shadow the
+        # module names. Only classes whose annotations are fully resolved in the module share the cache.
+        if local_vars.keys().isdisjoint(_IDENTIFIER_PATTERN.findall(" ".join(annotation_by_name.values()))):
+            return {
+                name: cls._get_module_type_hint_3_10(annotation, module_name)
+                for name, annotation in annotation_by_name.items()
+            }
+        resource_module_vars = cls._get_module_namespace(module_name)
         return {
-            name: cls._create_type_hint_3_10(parameter.annotation, resource_module_vars, local_vars)
-            for name, parameter in signature310.parameters.items()
-            if name != "self"
+            name: cls._create_type_hint_3_10(annotation, resource_module_vars, local_vars)
+            for name, annotation in annotation_by_name.items()
         }
 
+    @classmethod
+    @cache
+    def _get_module_type_hint_3_10(cls, annotation: str, module_name: str) -> Any:
+        # The same annotations, for example, 'str | None', are used across many classes in the same module.
+        return cls._create_type_hint_3_10(annotation, cls._get_module_namespace(module_name), {})
+
     @classmethod
     def _create_type_hint_3_10(
-        cls, annotation: str, resource_module_vars: dict[str, Any], local_vars: dict[str, Any]
+        cls, annotation: str, resource_module_vars: dict[str, Any], local_vars: Mapping[str, Any]
     ) -> Any:
-        if annotation.endswith(" | None"):
-            annotation = annotation[:-7]
-        annotation = annotation.replace("SequenceNotStr", "Sequence")
+        # The None part of optional hints is dropped and SequenceNotStr is treated as Sequence.
+        annotation = annotation.removesuffix(" | None")
+        if "SequenceNotStr" in annotation:
+            annotation = annotation.replace("SequenceNotStr", "Sequence")
         try:
-            return eval(annotation, resource_module_vars, local_vars)
+            return eval(_compile_annotation(annotation), resource_module_vars, local_vars)
         except (TypeError, NameError):
             # Python 3.10 Type Hint
-            if annotation.startswith("Sequence[") and annotation.endswith("]"):
-                return typing.Sequence[cls._create_type_hint_3_10(annotation[9:-1], resource_module_vars, local_vars)]  # type: ignore[misc]
-            else:
+            # Peel off all the Sequence[...] wrappers in one pass, such that only the innermost
+            # annotation is evaluated, instead of attempting an eval for every level of nesting.
+            generics: list[Any] = []
+            while annotation.endswith("]"):
+                name, _, inner = annotation.partition("[")
+                if (generic := _GENERIC_BY_NAME.get(name)) is None:
+                    break
+                generics.append(generic)
+                annotation = inner[:-1]
+            if not generics:
                 raise
+            hint = cls._create_type_hint_3_10(annotation, resource_module_vars, local_vars)
+            for generic in reversed(generics):
+                hint = generic[hint]
+            return hint
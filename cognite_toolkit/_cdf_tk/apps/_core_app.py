@@ -26,9 +26,6 @@ class Common:
     override_env: bool
 
 
-CDF_TOML = CDFToml.load(Path.cwd())
-
-
 def _version_callback(value: bool) -> None:
     if value:
         typer.echo(f"CDF-Toolkit version: {current_version}.")
@@ -132,13 +129,13 @@ class CoreApp(typer.Typer):
         self,
         ctx: typer.Context,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Where to find the module templates to build from",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         build_dir: Annotated[
             Path,
             typer.Option(
@@ -162,7 +159,7 @@ class CoreApp(typer.Typer):
                 "-e",
                 help="The name of the environment to build",
             ),
-        ] = CDF_TOML.cdf.default_env,
+        ] = None,
         no_clean: Annotated[
             bool,
             typer.Option(
@@ -196,6 +193,9 @@ class CoreApp(typer.Typer):
                 client = EnvironmentVariables.create_from_environment().get_client()
 
         cmd = BuildCommand()
+        cdf_toml = CDFToml.load()
+        organization_dir = organization_dir or cdf_toml.cdf.default_organization_dir
+        build_env_name = build_env_name or cdf_toml.cdf.default_env
         cmd.run(
             lambda: cmd.execute(
                 verbose,
@@ -9,8 +9,6 @@ from cognite_toolkit._cdf_tk.commands import ModulesCommand, PullCommand
 from cognite_toolkit._cdf_tk.utils.auth import EnvironmentVariables
 from cognite_toolkit._version import __version__
 
-CDF_TOML = CDFToml.load(Path.cwd())
-
 
 class ModulesApp(typer.Typer):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore
@@ -74,13 +72,13 @@ class ModulesApp(typer.Typer):
     def upgrade(
         self,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Where to find the module templates to build from",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         verbose: Annotated[
             bool,
             typer.Option(
@@ -91,6 +89,7 @@ class ModulesApp(typer.Typer):
         ] = False,
     ) -> None:
         cmd = ModulesCommand()
+        organization_dir = organization_dir or CDFToml.load().cdf.default_organization_dir
         cmd.run(lambda: cmd.upgrade(organization_dir=organization_dir, verbose=verbose))
 
     # This is a trick to use an f-string for the docstring
@@ -99,13 +98,13 @@ class ModulesApp(typer.Typer):
     def add(
         self,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Path to project directory with the modules. This is used to search for available functions.",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         verbose: Annotated[
             bool,
             typer.Option(
@@ -117,6 +116,7 @@ class ModulesApp(typer.Typer):
     ) -> None:
         """Add one or more new module(s) to the project."""
         cmd = ModulesCommand()
+        organization_dir = organization_dir or CDFToml.load().cdf.default_organization_dir
         cmd.run(lambda: cmd.add(organization_dir=organization_dir))
 
     def pull(
@@ -130,21 +130,21 @@ class ModulesApp(typer.Typer):
             ),
         ] = None,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Where to find the module templates to build from",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         build_env: Annotated[
-            str,
+            Optional[str],
             typer.Option(
                 "--env",
                 "-e",
                 help="Build environment to use.",
             ),
-        ] = CDF_TOML.cdf.default_env,
+        ] = None,
         dry_run: Annotated[
             bool,
             typer.Option(
@@ -164,6 +164,9 @@ class ModulesApp(typer.Typer):
     ) -> None:
         """Pull a module from CDF. This will overwrite the local files with the latest version from CDF."""
         cmd = PullCommand()
+        cdf_toml = CDFToml.load()
+        organization_dir = organization_dir or cdf_toml.cdf.default_organization_dir
+        build_env = build_env or cdf_toml.cdf.default_env
         env_vars = EnvironmentVariables.create_from_environment()
         cmd.run(
             lambda: cmd.pull_module(
@@ -179,20 +182,20 @@ class ModulesApp(typer.Typer):
     def list(
         self,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Where to find the module templates to build from",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         build_env: Annotated[
             Optional[str],
             typer.Option(
                 "--env",
                 help="Build environment to use.",
             ),
-        ] = CDF_TOML.cdf.default_env,
+        ] = None,
         verbose: Annotated[
             bool,
             typer.Option(
@@ -204,4 +207,7 @@ class ModulesApp(typer.Typer):
     ) -> None:
         """List all available modules in the project."""
         cmd = ModulesCommand()
+        cdf_toml = CDFToml.load()
+        organization_dir = organization_dir or cdf_toml.cdf.default_organization_dir
+        build_env = build_env or cdf_toml.cdf.default_env
         cmd.run(lambda: cmd.list(organization_dir=organization_dir, build_env_name=build_env))
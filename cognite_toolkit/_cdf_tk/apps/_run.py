@@ -12,8 +12,6 @@ from cognite_toolkit._cdf_tk.commands import (
 )
 from cognite_toolkit._cdf_tk.utils.auth import EnvironmentVariables
 
-CDF_TOML = CDFToml.load(Path.cwd())
-
 
 class RunApp(typer.Typer):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -75,13 +73,13 @@ class RunApp(typer.Typer):
             ),
         ] = None,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Path to project directory with the modules. This is used to search for available functions.",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         env_name: Annotated[
             Optional[str],
             typer.Option(
@@ -89,7 +87,7 @@ class RunApp(typer.Typer):
                 "-e",
                 help="Name of the build environment to use. If not provided, the default environment will be used.",
             ),
-        ] = CDF_TOML.cdf.default_env,
+        ] = None,
         wait: Annotated[
             bool,
             typer.Option(
@@ -109,6 +107,9 @@ class RunApp(typer.Typer):
     ) -> None:
         """This command will run the specified workflow."""
         cmd = RunWorkflowCommand()
+        cdf_toml = CDFToml.load()
+        organization_dir = organization_dir or cdf_toml.cdf.default_organization_dir
+        env_name = env_name or cdf_toml.cdf.default_env
         env_vars = EnvironmentVariables.create_from_environment()
         cmd.run(lambda: cmd.run_workflow(env_vars, organization_dir, env_name, external_id, version, wait))
 
@@ -136,13 +137,13 @@ class RunFunctionApp(typer.Typer):
             ),
         ] = None,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Path to project directory with the modules. This is used to search for available functions.",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         env_name: Annotated[
             Optional[str],
             typer.Option(
@@ -150,7 +151,7 @@ class RunFunctionApp(typer.Typer):
                 "-e",
                 help="Name of the build environment to use. If not provided, the default environment will be used.",
             ),
-        ] = CDF_TOML.cdf.default_env,
+        ] = None,
         schedule: Annotated[
             Optional[str],
             typer.Option(
@@ -179,6 +180,9 @@ class RunFunctionApp(typer.Typer):
     ) -> None:
         """This command will run the specified function locally."""
         cmd = RunFunctionCommand()
+        cdf_toml = CDFToml.load()
+        organization_dir = organization_dir or cdf_toml.cdf.default_organization_dir
+        env_name = env_name or cdf_toml.cdf.default_env
         env_vars = EnvironmentVariables.create_from_environment()
         cmd.run(
             lambda: cmd.run_local(
@@ -202,13 +206,13 @@ class RunFunctionApp(typer.Typer):
             ),
         ] = None,
         organization_dir: Annotated[
-            Path,
+            Optional[Path],
             typer.Option(
                 "--organization-dir",
                 "-o",
                 help="Path to organization directory with the modules. This is used to search for available functions.",
             ),
-        ] = CDF_TOML.cdf.default_organization_dir,
+        ] = None,
         env_name: Annotated[
             Optional[str],
             typer.Option(
@@ -216,7 +220,7 @@ class RunFunctionApp(typer.Typer):
                 "-e",
                 help="Name of the build environment to use. If not provided, the default environment will be used.",
             ),
-        ] = CDF_TOML.cdf.default_env,
+        ] = None,
         schedule: Annotated[
             Optional[str],
             typer.Option(
@@ -244,5 +248,8 @@ class RunFunctionApp(typer.Typer):
     ) -> None:
         """This command will run the specified function (assuming it is deployed) in CDF."""
         cmd = RunFunctionCommand()
+        cdf_toml = CDFToml.load()
+        organization_dir = organization_dir or cdf_toml.cdf.default_organization_dir
+        env_name = env_name or cdf_toml.cdf.default_env
         env_vars = EnvironmentVariables.create_from_environment()
         cmd.run(lambda: cmd.run_cdf(env_vars, organization_dir, env_name, external_id, schedule, wait))
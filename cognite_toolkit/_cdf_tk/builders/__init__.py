@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from ._base import Builder, DefaultBuilder, get_loader
 from ._datamodels import DataModelBuilder
@@ -19,7 +21,13 @@ def create_builder(
     return DefaultBuilder(build_dir, resource_folder)
 
 
-_BUILDER_BY_RESOURCE_FOLDER = {_builder._resource_folder: _builder for _builder in Builder.__subclasses__()}
+_BUILDER_BY_RESOURCE_FOLDER: Mapping[str, type[Builder]] = MappingProxyType(
+    {
+        _builder._resource_folder: _builder
+        for _builder in Builder.__subclasses__()
+        if _builder._resource_folder is not None
+    }
+)
 __all__ = [
     "Builder",
     "DataModelBuilder",
@@ -1,6 +1,7 @@
 import difflib
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Sequence
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, cast
 
@@ -45,6 +46,8 @@ class Builder(ABC):
     ):
         self._build_dir = build_dir
         self.resource_counter = 0
+        # All files of a builder are written to the same directory, so we only need to create it once.
+        self._created_dirs: set[Path] = set()
         if self._resource_folder is not None:
             self.resource_folder = self._resource_folder
         elif resource_folder is not None:
@@ -85,19 +88,24 @@ class Builder(ABC):
         with a number to ensure uniqueness.
         """
         filestem = source_path.stem
-        # Get rid of the local index
-        filestem = INDEX_PATTERN.sub("", filestem)
+        # Get rid of the local index. The index pattern is anchored at the start, so
+        # we only need to run the regex if the stem starts with a digit.
+        if filestem[:1].isdigit():
+            filestem = INDEX_PATTERN.sub("", filestem)
 
         # Increment to ensure we do not get duplicate filenames when we flatten the file
         # structure from the module to the build directory.
         self.resource_counter += 1
 
         filename = f"{self.resource_counter}.{filestem}"
-        if not filename.casefold().endswith(kind.casefold()):
+        # Only the tail of the stem can match the kind, so there is no need to casefold the entire filename.
+        if filestem[-len(kind) :].casefold() != kind.casefold():
             filename = f"{filename}.{kind}"
         filename = f"{filename}{source_path.suffix}"
         destination_path = self.build_dir / self.resource_folder / filename
-        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        if (parent := destination_path.parent) not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
         return destination_path
 
     def _get_loader(self, source_path: Path) -> tuple[None, ToolkitWarning] | tuple[type[ResourceLoader], None]:
@@ -123,19 +131,16 @@ def get_loader(
         suggestion: str | None = None
         if "." in source_path.stem:
             core, kind = source_path.stem.rsplit(".", 1)
-            match = difflib.get_close_matches(kind, [loader.kind for loader in folder_loaders])
+            match = _get_close_kind_matches(resource_folder, kind)
             if match:
                 suggested_name = f"{core}.{match[0]}{source_path.suffix}"
                 suggestion = f"Did you mean to call the file {suggested_name!r}?"
         else:
-            kinds = [loader.kind for loader in folder_loaders]
+            kinds = _get_folder_kinds(resource_folder)
             if len(kinds) == 1:
                 suggestion = f"Did you mean to call the file '{source_path.stem}.{kinds[0]}{source_path.suffix}'?"
             else:
-                suggestion = (
-                    f"All files in the {resource_folder!r} folder must have a file extension that matches "
-                    f"the resource type. Supported types are: {humanize_collection(kinds)}."
-                )
+                suggestion = _get_supported_kinds_suggestion(resource_folder)
         return None, UnknownResourceTypeWarning(source_path, suggestion)
     elif len(loaders) > 1 and all(loader.folder_name == "raw" for loader in loaders):
         # Raw files can be ambiguous, so we need to check the content.
@@ -163,6 +168,27 @@ def get_loader(
     return cast(type[ResourceLoader], loaders[0]), None
 
 
+@cache
+def _get_folder_kinds(resource_folder: str) -> tuple[str, ...]:
+    # The loaders, and thus the kinds, are fixed for a given resource folder.
+    return tuple(loader.kind for loader in LOADER_BY_FOLDER_NAME.get(resource_folder, []))
+
+
+@lru_cache(maxsize=256)
+def _get_close_kind_matches(resource_folder: str, kind: str) -> tuple[str, ...]:
+    # Misspelled kinds are typically repeated across many files, and the
+    # matching is quadratic in the length of the strings.
+    return tuple(difflib.get_close_matches(kind, _get_folder_kinds(resource_folder)))
+
+
+@cache
+def _get_supported_kinds_suggestion(resource_folder: str) -> str:
+    return (
+        f"All files in the {resource_folder!r} folder must have a file extension that matches "
+        f"the resource type. Supported types are: {humanize_collection(_get_folder_kinds(resource_folder))}."
+    )
+
+
 class DefaultBuilder(Builder):
     """This is used to build resources that do not have a specific builder."""
 
@@ -4,6 +4,7 @@ import re
 import sys
 from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -37,7 +38,13 @@ class CLIConfig:
     def load(cls, raw: dict[str, Any], cwd: Path) -> CLIConfig:
         has_user_set_default_org = "default_organization_dir" in raw
         has_user_set_default_env = "default_env" in raw
-        default_organization_dir = cwd / raw["default_organization_dir"] if has_user_set_default_org else Path.cwd()
+        if has_user_set_default_org:
+            default_organization_dir = Path(raw["default_organization_dir"])
+            # A relative organization directory is relative to the directory of the cdf.toml file.
+            if not default_organization_dir.is_absolute():
+                default_organization_dir = cwd / default_organization_dir
+        else:
+            default_organization_dir = Path.cwd()
         return cls(
             default_organization_dir=default_organization_dir,
             default_env=raw.get("default_env", "dev"),
@@ -80,11 +87,10 @@ class CDFToml:
     @classmethod
     def load(cls, cwd: Path | None = None, use_singleton: bool = True) -> CDFToml:
         """Loads the cdf.toml file from the given path. If use_singleton is True, the instance will be stored as a
-        singleton and returned on subsequent calls."""
-        global _CDF_TOML
-        if use_singleton and _CDF_TOML:
-            return _CDF_TOML
-        cwd = cwd or Path.cwd()
+        singleton for the given directory and returned on subsequent calls."""
+        cwd = (cwd or Path.cwd()).absolute()
+        if use_singleton and (cached := _CDF_TOML_BY_DIRECTORY.get(cwd)):
+            return cached
         file_path = cwd / cls.file_name
         if file_path.exists():
             raw = _read_toml(file_path)
@@ -95,22 +101,17 @@ class CDFToml:
                 modules = ModulesConfig.load(raw["modules"])
             except KeyError as e:
                 raise ToolkitRequiredValueError(f"Missing required value in {cls.file_name}: {e.args}")
-            alpha_flags = {}
-            if "alpha_flags" in raw:
-                alpha_flags = {clean_name(k): v for k, v in raw["alpha_flags"].items()}
+            alpha_flags = _clean_section(raw, "alpha_flags")
             if not alpha_flags and "feature_flags" in raw:
                 MediumSeverityWarning(
                     "The 'feature_flags' section has been renamed to 'alpha_flags'. Please update your cdf.toml file."
                 ).print_warning()
-                alpha_flags = {clean_name(k): v for k, v in raw["feature_flags"].items()}
-
-            plugins = {}
-            if "plugins" in raw:
-                plugins = {clean_name(k): v for k, v in raw["plugins"].items()}
+                alpha_flags = _clean_section(raw, "feature_flags")
+            plugins = _clean_section(raw, "plugins")
 
             instance = cls(cdf=cdf, modules=modules, alpha_flags=alpha_flags, plugins=plugins, is_loaded_from_file=True)
             if use_singleton:
-                _CDF_TOML = instance
+                _CDF_TOML_BY_DIRECTORY[cwd] = instance
             return instance
         else:
             return cls(
@@ -122,12 +123,29 @@ class CDFToml:
             )
 
 
+def _clean_section(raw: dict[str, Any], key: str) -> dict[str, Any]:
+    if section := raw.get(key):
+        return {clean_name(k): v for k, v in section.items()}
+    return {}
+
+
 def _read_toml(file_path: Path) -> dict[str, Any]:
-    # TOML files are required to be UTF-8 encoded
-    content = file_path.read_text(encoding="utf-8")
+    # The modification time and size are part of the cache key, such that changes to the file,
+    # for example, by the modules upgrade command, are picked up.
+    stat = file_path.stat()
+    return _read_toml_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _read_toml_cached(file_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Reads and parses the TOML file. The output is cached, and should thus be treated as read-only."""
     try:
-        return tomllib.loads(content)
+        # The parser decodes the bytes as UTF-8, which is required for TOML files.
+        with file_path.open("rb") as file:
+            return tomllib.load(file)
     except TOMLDecodeError as e:
+        # The text is only needed for the hint in the error message.
+        content = file_path.read_text(encoding="utf-8")
         if file_path.is_relative_to(Path.cwd()):
             file_path = file_path.relative_to(Path.cwd())
         extra = ""
@@ -153,7 +171,7 @@ def _read_toml(file_path: Path) -> dict[str, Any]:
         raise SystemExit(1)
 
 
-_CDF_TOML: CDFToml | None = None
+_CDF_TOML_BY_DIRECTORY: dict[Path, CDFToml] = {}
 
 if __name__ == "__main__":
     from pprint import pprint
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Literal, cast
 
 from cognite.client import ClientConfig, CogniteClient
@@ -11,6 +12,24 @@ from .api.lookup import LookUpGroup
 from .api.robotics import RoboticsAPI
 from .api.verify import VerifyAPI
 
+_CLOUD_PROVIDER_BY_CLUSTER: dict[str, Literal["azure", "aws", "gcp"]] = {
+    "azure-dev": "azure",
+    "bluefield": "azure",
+    "westeurope-1": "azure",
+    "orangefield": "aws",
+    "greenfield": "gcp",
+    "asia-northeast1-1": "gcp",
+    "cognitedata-development": "gcp",
+    "cognitedata-production": "gcp",
+}
+_CLOUD_PROVIDER_BY_CLUSTER_PREFIX: tuple[tuple[str, Literal["azure", "aws", "gcp"]], ...] = (
+    ("az-", "azure"),
+    ("aws-", "aws"),
+    ("gc-", "gcp"),
+)
+# Private link clusters have 'plink' in the host name, for example, https://plink.westeurope-1.cognitedata.com
+_PRIVATE_LINK_PATTERN = re.compile(r"plink[^/]*\.cognitedata\.com")
+
 
 class ToolkitClientConfig(ClientConfig):
     def __init__(
@@ -46,26 +65,16 @@ class ToolkitClientConfig(ClientConfig):
         cdf_cluster = self.cdf_cluster
         if cdf_cluster is None:
             return "unknown"
-        elif cdf_cluster.startswith("az-") or cdf_cluster in {"azure-dev", "bluefield", "westeurope-1"}:
-            return "azure"
-        elif cdf_cluster.startswith("aws-") or cdf_cluster in {"orangefield"}:
-            return "aws"
-        elif cdf_cluster.startswith("gc-") or cdf_cluster in {
-            "greenfield",
-            "asia-northeast1-1",
-            "cognitedata-development",
-            "cognitedata-production",
-        }:
-            return "gcp"
-        else:
-            return "unknown"
+        if provider := _CLOUD_PROVIDER_BY_CLUSTER.get(cdf_cluster):
+            return provider
+        for prefix, provider in _CLOUD_PROVIDER_BY_CLUSTER_PREFIX:
+            if cdf_cluster.startswith(prefix):
+                return provider
+        return "unknown"
 
     @property
     def is_private_link(self) -> bool:
-        if "cognitedata.com" not in self.base_url:
-            return False
-        subdomain = self.base_url.split("cognitedata.com", maxsplit=1)[0]
-        return "plink" in subdomain
+        return _PRIVATE_LINK_PATTERN.search(self.base_url) is not None
 
 
 class ToolkitClient(CogniteClient):
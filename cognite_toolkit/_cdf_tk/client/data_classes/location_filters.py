@@ -69,6 +69,10 @@ class LocationFilterView(ViewId):
         return output
 
 
+# The keys are the same in camel and snake case.
+_ASSET_CENTRIC_SUBFILTERS = ("assets", "events", "files", "timeseries", "sequences")
+
+
 @dataclass
 class AssetCentricSubFilter(CogniteObject):
     data_set_ids: list[int] | None = None
@@ -87,20 +91,13 @@ class AssetCentricFilter(CogniteObject):
     asset_subtree_ids: list[dict[Literal["externalId", "id"], int | str]] | None = None
     external_id_prefix: str | None = None
 
-    @classmethod
-    def _load_subfilter(cls, resource: dict[str, Any], key: str) -> AssetCentricSubFilter | None:
-        if key in resource:
-            return AssetCentricSubFilter.load(resource[key])
-        return None
-
     @classmethod
     def _load(cls, resource: dict[str, Any], cognite_client: CogniteClient | None = None) -> AssetCentricFilter:
+        subfilters = {
+            key: AssetCentricSubFilter.load(resource[key]) for key in _ASSET_CENTRIC_SUBFILTERS if key in resource
+        }
         return cls(
-            assets=cls._load_subfilter(resource, "assets"),
-            events=cls._load_subfilter(resource, "events"),
-            files=cls._load_subfilter(resource, "files"),
-            timeseries=cls._load_subfilter(resource, "timeseries"),
-            sequences=cls._load_subfilter(resource, "sequences"),
+            **subfilters,
             data_set_ids=resource.get("dataSetIds"),
             asset_subtree_ids=resource.get("assetSubtreeIds"),
             external_id_prefix=resource.get("externalIdPrefix"),
@@ -108,19 +105,21 @@ class AssetCentricFilter(CogniteObject):
 
     def dump(self, camel_case: bool = True) -> dict[str, Any]:
         output = super().dump(camel_case)
-        if self.assets:
-            output["assets"] = self.assets.dump(camel_case)
-        if self.events:
-            output["events"] = self.events.dump(camel_case)
-        if self.files:
-            output["files"] = self.files.dump(camel_case)
-        if self.timeseries:
-            output["timeseries"] = self.timeseries.dump(camel_case)
-        if self.sequences:
-            output["sequences"] = self.sequences.dump(camel_case)
+        for key in _ASSET_CENTRIC_SUBFILTERS:
+            if subfilter := getattr(self, key):
+                output[key] = subfilter.dump(camel_case)
         return output
 
 
+# (attribute name, API key) for the optional fields that are loaded as is.
+_LOCATION_FILTER_OPTIONAL_FIELDS = (
+    ("parent_id", "parentId"),
+    ("description", "description"),
+    ("instance_spaces", "instanceSpaces"),
+    ("data_modeling_type", "dataModelingType"),
+)
+
+
 class LocationFilterCore(WriteableCogniteResource["LocationFilterWrite"], ABC):
     """
     LocationFilter contains information for a single LocationFilter.
@@ -193,25 +192,24 @@ class LocationFilterCore(WriteableCogniteResource["LocationFilterWrite"], ABC):
 class LocationFilterWrite(LocationFilterCore):
     @classmethod
     def _load(cls, resource: dict[str, Any], cognite_client: CogniteClient | None = None) -> Self:
-        scene = LocationFilterScene.load(resource.get("scene", {})) if resource.get("scene") else None
+        scene = LocationFilterScene.load(raw_scene) if (raw_scene := resource.get("scene")) else None
         data_models = (
-            [DataModelId.load(item) for item in resource.get("dataModels", {})] if resource.get("dataModels") else None
+            [DataModelId.load(item) for item in raw_data_models]
+            if (raw_data_models := resource.get("dataModels"))
+            else None
         )
         asset_centric = (
-            AssetCentricFilter.load(resource.get("assetCentric", {})) if resource.get("assetCentric") else None
+            AssetCentricFilter.load(raw_asset_centric) if (raw_asset_centric := resource.get("assetCentric")) else None
         )
         views = [LocationFilterView._load(view) for view in resource["views"]] if "views" in resource else None
         return cls(
             external_id=resource["externalId"],
             name=resource["name"],
-            parent_id=resource.get("parentId"),
-            description=resource.get("description"),
             data_models=data_models,
-            instance_spaces=resource.get("instanceSpaces"),
             scene=scene,
             asset_centric=asset_centric,
             views=views,
-            data_modeling_type=resource.get("dataModelingType"),
+            **{attribute: resource.get(key) for attribute, key in _LOCATION_FILTER_OPTIONAL_FIELDS},
         )
 
 
@@ -270,18 +268,15 @@ class LocationFilter(LocationFilterCore):
             id=resource["id"],
             external_id=resource["externalId"],
             name=resource["name"],
-            parent_id=resource.get("parentId"),
-            description=resource.get("description"),
             data_models=[DataModelId.load(item) for item in resource["dataModels"]]
             if "dataModels" in resource
             else None,
-            instance_spaces=resource.get("instanceSpaces"),
             scene=LocationFilterScene._load(resource["scene"]) if "scene" in resource else None,
             asset_centric=AssetCentricFilter._load(resource["assetCentric"]) if "assetCentric" in resource else None,
             views=[LocationFilterView._load(view) for view in resource["views"]] if "views" in resource else None,
             created_time=resource["createdTime"],
             updated_time=resource["lastUpdatedTime"],
-            data_modeling_type=resource.get("dataModelingType"),
+            **{attribute: resource.get(key) for attribute, key in _LOCATION_FILTER_OPTIONAL_FIELDS},
         )
 
 
@@ -293,4 +288,4 @@ class LocationFilterList(WriteableCogniteResourceList[LocationFilterWrite, Locat
     _RESOURCE = LocationFilter
 
     def as_write(self) -> LocationFilterWriteList:
-        return LocationFilterWriteList([LocationFilter.as_write() for LocationFilter in self])
+        return LocationFilterWriteList([location_filter.as_write() for location_filter in self])
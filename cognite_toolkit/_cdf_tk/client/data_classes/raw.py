@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
@@ -32,7 +33,8 @@ class RawTable(WriteableCogniteResource):
 
     @classmethod
     def _load(cls, resource: dict[str, Any], cognite_client: CogniteClient | None = None) -> RawTable:
-        return cls(db_name=resource["dbName"], table_name=resource["tableName"])
+        # The same database name repeats for every table in it, so we share one string per database.
+        return cls(db_name=sys.intern(resource["dbName"]), table_name=resource["tableName"])
 
     def dump(self, camel_case: bool = True) -> dict[str, Any]:
         return {
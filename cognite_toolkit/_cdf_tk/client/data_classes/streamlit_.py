@@ -10,6 +10,35 @@ from cognite.client.data_classes._base import (
     WriteableCogniteResourceList,
 )
 
+# (API key, argument name) for the optional fields that default to None.
+_STREAMLIT_OPTIONAL_FIELDS = (
+    ("description", "description"),
+    ("thumbnail", "thumbnail"),
+    ("dataSetId", "data_set_id"),
+)
+# (API key, argument name) for the fields with a default in __init__. These are only passed on if present,
+# to avoid specifying the defaults twice.
+_STREAMLIT_DEFAULTED_FIELDS = (
+    ("published", "published"),
+    ("theme", "theme"),
+    ("cogniteToolkitAppHash", "cognite_toolkit_app_hash"),
+)
+
+
+def _load_streamlit_args(resource: dict[str, Any]) -> dict[str, Any]:
+    args = dict(
+        external_id=resource["externalId"],
+        name=resource["name"],
+        creator=resource["creator"],
+        entrypoint=resource["entrypoint"],
+    )
+    for key, arg_name in _STREAMLIT_OPTIONAL_FIELDS:
+        args[arg_name] = resource.get(key)
+    for key, arg_name in _STREAMLIT_DEFAULTED_FIELDS:
+        if key in resource:
+            args[arg_name] = resource[key]
+    return args
+
 
 class _StreamlitCore(WriteableCogniteResource["StreamlitWrite"], ABC):
     def __init__(
@@ -60,22 +89,7 @@ class _StreamlitCore(WriteableCogniteResource["StreamlitWrite"], ABC):
 class StreamlitWrite(_StreamlitCore):
     @classmethod
     def _load(cls, resource: dict[str, Any], cognite_client: CogniteClient | None = None) -> "StreamlitWrite":
-        args = dict(
-            external_id=resource["externalId"],
-            name=resource["name"],
-            creator=resource["creator"],
-            entrypoint=resource["entrypoint"],
-            description=resource.get("description"),
-            thumbnail=resource.get("thumbnail"),
-            data_set_id=resource.get("dataSetId"),
-        )
-        # Trick to avoid specifying defaults twice
-        for key in ["published", "theme"]:
-            if key in resource:
-                args[key] = resource[key]
-        if "cogniteToolkitAppHash" in resource:
-            args["cognite_toolkit_app_hash"] = resource["cogniteToolkitAppHash"]
-        return cls(**args)
+        return cls(**_load_streamlit_args(resource))
 
     def as_write(self) -> "StreamlitWrite":
         return self
@@ -117,28 +131,11 @@ class Streamlit(_StreamlitCore):
 
     @classmethod
     def _load(cls, resource: dict[str, Any], cognite_client: CogniteClient | None = None) -> "Streamlit":
-        args = dict(
-            external_id=resource["externalId"],
-            name=resource["name"],
-            creator=resource["creator"],
-            entrypoint=resource["entrypoint"],
-            created_time=resource["createdTime"],
-            last_updated_time=resource["lastUpdatedTime"],
-            description=resource.get("description"),
-            thumbnail=resource.get("thumbnail"),
-            data_set_id=resource.get("dataSetId"),
-        )
-        # Trick to avoid specifying defaults twice
-        for key in ["theme", "app_hash"]:
-            if key in resource:
-                args[key] = resource[key]
-        if "cogniteToolkitAppHash" in resource:
-            args["cognite_toolkit_app_hash"] = resource["cogniteToolkitAppHash"]
-        if "published" in resource:
-            if isinstance(resource["published"], str):
-                args["published"] = resource["published"].strip().lower() == "true"
-            else:
-                args["published"] = resource["published"]
+        args = _load_streamlit_args(resource)
+        args["created_time"] = resource["createdTime"]
+        args["last_updated_time"] = resource["lastUpdatedTime"]
+        if isinstance(args.get("published"), str):
+            args["published"] = args["published"].strip().lower() == "true"
         return cls(**args)
 
     @classmethod
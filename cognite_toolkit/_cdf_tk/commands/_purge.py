@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import queue
+import threading
 import uuid
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import cache
 from graphlib import CycleError, TopologicalSorter
-from typing import cast
+from typing import Any, TypeVar, cast
 
 import questionary
 from cognite.client.data_classes import AggregateResultItem, DataSetUpdate, filters
@@ -15,6 +20,7 @@ from rich.panel import Panel
 from rich.status import Status
 
 from cognite_toolkit._cdf_tk.client import ToolkitClient
+from cognite_toolkit._cdf_tk.constants import IN_BROWSER
 from cognite_toolkit._cdf_tk.data_classes import DeployResults, ResourceDeployResult
 from cognite_toolkit._cdf_tk.exceptions import (
     CDFAPIError,
@@ -46,6 +52,83 @@ from cognite_toolkit._cdf_tk.utils import humanize_collection
 
 from ._base import ToolkitCommand
 
+T = TypeVar("T")
+
+# The number of parent IDs to retrieve children for in one call when purging.
+_PARENT_ID_CHUNK_SIZE = 100
+
+_END_OF_ITERATION = object()
+
+
+def _iterate_in_background(iterable: Iterable[T], max_prefetch: int) -> Iterator[T]:
+    """Iterates over the iterable in a background thread, such that the next items are retrieved
+    while the caller processes the current ones. At most max_prefetch items are held in memory."""
+    if IN_BROWSER:
+        # Pyodide does not support threading
+        yield from iterable
+        return
+
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=max_prefetch)
+    stop = threading.Event()
+    error: BaseException | None = None
+
+    def produce() -> None:
+        nonlocal error
+        try:
+            for item in iterable:
+                buffer.put(item)
+                if stop.is_set():
+                    return
+        except BaseException as e:
+            error = e
+        finally:
+            # The caller has stopped iterating if stop is set, and will not read the end marker.
+            if not stop.is_set():
+                buffer.put(_END_OF_ITERATION)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                item = buffer.get(timeout=1.0)
+            except queue.Empty:
+                if thread.is_alive() or not buffer.empty():
+                    continue
+                raise RuntimeError("Background iteration stopped without signalling the end of iteration")
+            if item is _END_OF_ITERATION:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        # Empty the buffer such that a producer blocked on a full buffer can see the stop event and exit.
+        with suppress(queue.Empty):
+            while True:
+                buffer.get_nowait()
+
+
+@cache
+def _get_dependent_loaders(loader_cls: type[ResourceLoader]) -> tuple[type[ResourceLoader], ...]:
+    # The loaders and their dependencies are fixed, so we only need to scan the loader list once per loader.
+    return tuple(dep_cls for dep_cls in RESOURCE_LOADER_LIST if loader_cls in dep_cls.dependencies)
+
+
+def _get_deletion_order(
+    loaders: dict[type[ResourceLoader], frozenset[type[ResourceLoader]]],
+) -> list[type[ResourceLoader]]:
+    """Returns the loaders in the order they must be deleted, i.e., dependents before their dependencies."""
+    if len(loaders) <= 1:
+        # Nothing to sort, which is the case for the child loaders of most loaders.
+        return list(loaders)
+    return [
+        loader_cls
+        for loader_cls in reversed(list(TopologicalSorter(loaders).static_order()))
+        # Necessary as the topological sort includes dependencies that are not in the loaders
+        if loader_cls in loaders
+    ]
+
 
 class PurgeCommand(ToolkitCommand):
     def space(
@@ -107,8 +190,8 @@ class PurgeCommand(ToolkitCommand):
     ) -> dict[type[ResourceLoader], frozenset[type[ResourceLoader]]]:
         return {
             dep_cls: dep_cls.dependencies
-            for dep_cls in RESOURCE_LOADER_LIST
-            if loader_cls in dep_cls.dependencies and (exclude is None or dep_cls not in exclude)
+            for dep_cls in _get_dependent_loaders(loader_cls)
+            if exclude is None or dep_cls not in exclude
         }
 
     @staticmethod
@@ -236,11 +319,12 @@ class PurgeCommand(ToolkitCommand):
         results = DeployResults([], "purge", dry_run=dry_run)
         loader_cls: type[ResourceLoader]
         has_purged_views = False
+        # Exclude loaders that we are already iterating over from the child loaders
+        parent_loaders = set(loaders)
+        # The same child loader can be used by several parent loaders, so we create each one once.
+        child_loader_by_cls: dict[type[ResourceLoader], ResourceLoader] = {}
         with Console().status("...", spinner="aesthetic", speed=0.4) as status:
-            for loader_cls in reversed(list(TopologicalSorter(loaders).static_order())):
-                if loader_cls not in loaders:
-                    # Dependency that is included
-                    continue
+            for loader_cls in _get_deletion_order(loaders):
                 loader = loader_cls.create_loader(client, console=status.console)
                 status_prefix = "Would have deleted" if dry_run else "Deleted"
                 if isinstance(loader, ViewLoader) and not dry_run:
@@ -273,18 +357,20 @@ class PurgeCommand(ToolkitCommand):
 
                 # Child loaders are, for example, WorkflowTriggerLoader, WorkflowVersionLoader for WorkflowLoader
                 # These must delete all resources that are connected to the resource that the loader is deleting
-                # Exclude loaders that we are already iterating over
-                child_loader_classes = self._get_dependencies(loader_cls, exclude=set(loaders))
-                child_loaders = [
-                    child_loader.create_loader(client)
-                    for child_loader in reversed(list(TopologicalSorter(child_loader_classes).static_order()))
-                    # Necessary as the topological sort includes dependencies that are not in the loaders
-                    if child_loader in child_loader_classes
-                ]
+                child_loader_classes = self._get_dependencies(loader_cls, exclude=parent_loaders)
+                child_loaders: list[ResourceLoader] = []
+                for child_loader_cls in _get_deletion_order(child_loader_classes):
+                    if child_loader_cls not in child_loader_by_cls:
+                        child_loader_by_cls[child_loader_cls] = child_loader_cls.create_loader(client)
+                    child_loaders.append(child_loader_by_cls[child_loader_cls])
                 count = 0
                 status.update(f"{status_prefix} {count:,} {loader.display_name}...")
                 batch_ids: list[Hashable] = []
-                for resource in loader.iterate(data_set_external_id=selected_data_set, space=selected_space):
+                # The next batch is retrieved while the current batch is deleted.
+                for resource in _iterate_in_background(
+                    loader.iterate(data_set_external_id=selected_data_set, space=selected_space),
+                    max_prefetch=batch_size,
+                ):
                     try:
                         batch_ids.append(loader.get_id(resource))
                     except (ToolkitRequiredValueError, KeyError) as e:
@@ -381,27 +467,96 @@ class PurgeCommand(ToolkitCommand):
             console.print(f"{prefix} {deleted:,} {loader.display_name}")
         return deleted, batch_size
 
-    @staticmethod
+    @classmethod
     def _delete_children(
-        parent_ids: list[Hashable], child_loaders: list[ResourceLoader], dry_run: bool, console: Console, verbose: bool
+        cls,
+        parent_ids: list[Hashable],
+        child_loaders: list[ResourceLoader],
+        dry_run: bool,
+        console: Console,
+        verbose: bool,
     ) -> dict[str, int]:
-        child_deletion: dict[str, int] = {}
-        for child_loader in child_loaders:
-            child_ids = set()
-            for child in child_loader.iterate(parent_ids=parent_ids):
-                child_ids.add(child_loader.get_id(child))
-            count = 0
-            if child_ids:
-                if dry_run:
-                    count = len(child_ids)
-                else:
-                    count = child_loader.delete(list(child_ids))
+        counts: dict[str, int] = {}
+        if IN_BROWSER or len(child_loaders) <= 1:
+            # Pyodide does not support threading
+            for child_loader in child_loaders:
+                counts[child_loader.display_name] = cls._delete_child_resources(
+                    parent_ids, child_loader, dry_run, console, verbose, child_loader.client.config.max_workers
+                )
+        else:
+            # The child loaders are independent API resources, so we delete them in parallel,
+            # except that a child loader must wait for the child loaders that depend on it.
+            with ThreadPoolExecutor(max_workers=len(child_loaders)) as executor:
+                for group in cls._group_independent_loaders(child_loaders):
+                    futures = {
+                        child_loader.display_name: executor.submit(
+                            cls._delete_child_resources,
+                            parent_ids,
+                            child_loader,
+                            dry_run,
+                            console,
+                            verbose,
+                            # The child loaders in a group share the client's request budget.
+                            max(1, child_loader.client.config.max_workers // len(group)),
+                        )
+                        for child_loader in group
+                    }
+                    counts.update({name: future.result() for name, future in futures.items()})
+        # Keep the order of the child loaders in the results.
+        return {child_loader.display_name: counts[child_loader.display_name] for child_loader in child_loaders}
+
+    @staticmethod
+    def _group_independent_loaders(loaders: list[ResourceLoader]) -> list[list[ResourceLoader]]:
+        """Splits the loaders, which are in deletion order, into consecutive groups where
+        no loader depends on another loader in the same group."""
+        groups: list[list[ResourceLoader]] = []
+        for loader in loaders:
+            if groups and not any(type(loader) in type(member).dependencies for member in groups[-1]):
+                groups[-1].append(loader)
+            else:
+                groups.append([loader])
+        return groups
 
-                if verbose:
-                    prefix = "Would delete" if dry_run else "Deleted"
-                    console.print(f"{prefix} {count:,} {child_loader.display_name}")
-            child_deletion[child_loader.display_name] = count
-        return child_deletion
+    @staticmethod
+    def _delete_child_resources(
+        parent_ids: list[Hashable],
+        child_loader: ResourceLoader,
+        dry_run: bool,
+        console: Console,
+        verbose: bool,
+        max_workers: int,
+    ) -> int:
+        if IN_BROWSER or not child_loader.iterate_per_parent_id or len(parent_ids) <= _PARENT_ID_CHUNK_SIZE:
+            # Loaders that filter on, or list, all parents at once must be called once with all parent IDs.
+            children = list(child_loader.iterate(parent_ids=parent_ids))
+        else:
+            # The loader makes one request per parent, so we retrieve the children of the parent chunks in parallel.
+            chunks = [
+                parent_ids[start : start + _PARENT_ID_CHUNK_SIZE]
+                for start in range(0, len(parent_ids), _PARENT_ID_CHUNK_SIZE)
+            ]
+            with ThreadPoolExecutor(max_workers=min(len(chunks), max_workers)) as executor:
+                children = [
+                    child
+                    for chunk_children in executor.map(
+                        lambda chunk: list(child_loader.iterate(parent_ids=chunk)), chunks
+                    )
+                    for child in chunk_children
+                ]
+        # A child can belong to more than one of the parents, for example, a relationship between two assets,
+        # so the IDs must be deduplicated. The dict keeps the retrieval order.
+        child_ids = list(dict.fromkeys(child_loader.get_id(child) for child in children))
+        count = 0
+        if child_ids:
+            if dry_run:
+                count = len(child_ids)
+            else:
+                count = child_loader.delete(child_ids)
+
+            if verbose:
+                prefix = "Would delete" if dry_run else "Deleted"
+                console.print(f"{prefix} {count:,} {child_loader.display_name}")
+        return count
 
     def _purge_nodes(
         self,
@@ -10,12 +10,13 @@ from cognite_toolkit._cdf_tk.loaders._base_loaders import T_ID, T_WritableCognit
 
 
 def _print_ids_or_length(resource_ids: SequenceNotStr[T_ID], limit: int = 10) -> str:
-    if len(resource_ids) == 1:
+    count = len(resource_ids)
+    if count == 1:
         return f"{resource_ids[0]!r}"
-    elif len(resource_ids) <= limit:
+    elif count <= limit:
         return f"{resource_ids}"
     else:
-        return f"{len(resource_ids)} items"
+        return f"{count} items"
 
 
 def _remove_duplicates(
@@ -9,20 +9,37 @@ from subprocess import DEVNULL, Popen
 from types import SimpleNamespace
 
 from cognite_toolkit._cdf_tk.exceptions import ToolkitEnvError
+from cognite_toolkit._cdf_tk.feature_flags import Flags
 
 
 class FunctionVirtualEnvironment(venv.EnvBuilder):
     def __init__(self, requirements_txt: Path | str, rebuild: bool) -> None:
+        # uv installs packages much faster than pip. It is opt-in, as it does not read the pip configuration,
+        # for example, a private package index.
+        self._uv_executable = shutil.which("uv") if Flags.UV_INSTALL.is_enabled() else None
         super().__init__(
             system_site_packages=False,
             clear=rebuild,
-            with_pip=True,
+            # uv installs into the environment from the outside, so the environment does not need its own pip.
+            with_pip=self._uv_executable is None,
         )
         self.requirements_txt = requirements_txt
         self._context: SimpleNamespace | None = None
 
     def post_setup(self, context: SimpleNamespace) -> None:
-        args = [str(Path(context.bin_path) / "pip"), "install", "--disable-pip-version-check", "-r", "requirements.txt"]
+        if self._uv_executable:
+            # uv does not compile the packages by default.
+            args = [self._uv_executable, "pip", "install", "--python", str(context.env_exe), "-r", "requirements.txt"]
+        else:
+            args = [
+                str(Path(context.bin_path) / "pip"),
+                "install",
+                "--disable-pip-version-check",
+                # The packages are compiled on first import instead, which is only done for the modules the function uses.
+                "--no-compile",
+                "-r",
+                "requirements.txt",
+            ]
 
         function_dir = Path(context.env_dir).parent
         requirements_destination_path = function_dir / "requirements.txt"
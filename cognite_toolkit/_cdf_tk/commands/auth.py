@@ -14,10 +14,12 @@
 from __future__ import annotations
 
 import itertools
+import json
 import shutil
 import time
 import warnings
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from time import sleep
@@ -159,9 +161,19 @@ class AuthCommand(ToolkitCommand):
         self.check_identity_provider(client, cdf_project)
 
         try:
-            user_groups = client.iam.groups.list()
+            # The group access check above ensures that we can list all groups.
+            all_groups = client.iam.groups.list(all=True)
         except CogniteAPIError as e:
             raise AuthorizationError(f"Unable to retrieve CDF groups.\n{e}")
+        # The token inspection lists the groups the current user is member of, so we do not need
+        # a second request to list the user's groups.
+        user_group_ids = {
+            group_id
+            for project in token_inspection.projects
+            if project.url_name == cdf_project
+            for group_id in project.groups
+        }
+        user_groups = GroupList([group for group in all_groups if group.id in user_group_ids])
 
         if not user_groups:
             raise AuthorizationError("The current user is not member of any groups in the CDF project.")
@@ -186,17 +198,23 @@ class AuthCommand(ToolkitCommand):
             if is_interactive:
                 Prompt.ask("Press enter key to continue...")
 
-        all_groups = client.iam.groups.list(all=True)
+        # Group names are not unique, so we keep all groups with the same name in the order they are listed.
+        all_groups_by_name: dict[str, list[Group]] = defaultdict(list)
+        for group in all_groups:
+            all_groups_by_name[group.name].append(group)
+        user_group_by_name: dict[str, Group] = {}
+        for group in user_groups:
+            user_group_by_name.setdefault(group.name, group)
 
-        is_user_in_toolkit_group = any(group.name == toolkit_group.name for group in user_groups)
-        is_toolkit_group_existing = any(group.name == toolkit_group.name for group in all_groups)
+        is_user_in_toolkit_group = toolkit_group.name in user_group_by_name
+        is_toolkit_group_existing = toolkit_group.name in all_groups_by_name
 
         print(f"Checking current client is member of the {toolkit_group.name!r} group...")
         has_added_capabilities = False
         cdf_toolkit_group: Group | None
         if is_user_in_toolkit_group:
             print(f"  [bold green]OK[/] - The current client is member of the {toolkit_group.name!r} group.")
-            cdf_toolkit_group = next(group for group in user_groups if group.name == toolkit_group.name)
+            cdf_toolkit_group = user_group_by_name[toolkit_group.name]
             missing_capabilities = self._check_missing_capabilities(
                 client, cdf_toolkit_group, toolkit_group, loaders_by_capability_tuple, is_interactive
             )
@@ -212,7 +230,7 @@ class AuthCommand(ToolkitCommand):
             self.warn(MediumSeverityWarning(f"The current client is not member of the {toolkit_group.name!r} group."))
             print(f"Checking if the group {toolkit_group.name!r} has the required capabilities...")
             # Update the group with the missing capabilities
-            cdf_toolkit_group = next(group for group in all_groups if group.name == toolkit_group.name)
+            cdf_toolkit_group = all_groups_by_name[toolkit_group.name][0]
             missing_capabilities = self._check_missing_capabilities(
                 client, cdf_toolkit_group, toolkit_group, loaders_by_capability_tuple, is_interactive
             )
@@ -249,7 +267,7 @@ class AuthCommand(ToolkitCommand):
 
             self.check_source_id_usage(all_groups, cdf_toolkit_group)
 
-            if extra := self.check_duplicated_names(all_groups, cdf_toolkit_group):
+            if extra := self.check_duplicated_names(all_groups_by_name[cdf_toolkit_group.name], cdf_toolkit_group):
                 if (
                     is_interactive
                     and questionary.confirm("Do you want to delete the extra groups?", default=True).ask()
@@ -345,13 +363,16 @@ class AuthCommand(ToolkitCommand):
             return []
 
         missing_capabilities = self._merge_capabilities(missing_capabilities)
-        for s in sorted(map(str, missing_capabilities)):
+        for s in sorted(str(capability) for capability in missing_capabilities):
             self.warn(MissingCapabilityWarning(s))
 
-        resource_names: set[str] = set()
-        for cap in missing_capabilities:
-            for cap_tuple in cap.as_tuples():
-                resource_names.update(loaders_by_capability_id[cap_tuple])
+        # Using .get to avoid inserting empty entries into the defaultdict.
+        resource_names = {
+            name
+            for cap in missing_capabilities
+            for cap_tuple in cap.as_tuples()
+            for name in loaders_by_capability_id.get(cap_tuple, ())
+        }
         if resource_names:
             print("[bold yellow]INFO:[/] The missing capabilities are required for the following resources:")
             for resource_name in resource_names:
@@ -371,27 +392,22 @@ class AuthCommand(ToolkitCommand):
         dry_run: bool,
     ) -> bool:
         """Updates the missing capabilities. This assumes interactive mode."""
-        updated_toolkit_group = GroupWrite.load(existing_group.dump())
-        if updated_toolkit_group.capabilities is None:
-            updated_toolkit_group.capabilities = missing_capabilities
-        else:
-            updated_toolkit_group.capabilities.extend(missing_capabilities)
+        # Building the write object directly avoids a dump/load round trip over all existing capabilities.
+        updated_toolkit_group = GroupWrite(
+            name=existing_group.name,
+            source_id=existing_group.source_id,
+            capabilities=[*(existing_group.capabilities or []), *missing_capabilities],
+            metadata=existing_group.metadata,
+            members=existing_group.members,
+        )
 
-        with warnings.catch_warnings():
-            # If the user has unknown capabilities, we don't want the user to see the warning:
-            # "UserWarning: Unknown capability '<unknown warning>' will be ignored in comparison"
-            # This is irrelevant for the user as we are only checking the capabilities below
-            # (triggered by the verify_authorization calls)
-            warnings.simplefilter("ignore")
-            adding = client.iam.compare_capabilities(
-                existing_group.capabilities or [],
-                updated_toolkit_group.capabilities or [],
-                project=client.config.project,
-            )
-        adding = self._merge_capabilities(adding)
-        capability_str = "capabilities" if len(adding) > 1 else "capability"
+        # The missing capabilities are already compared against the existing group and merged
+        # by _check_missing_capabilities, so we do not need to compare them again.
+        capability_str = "capabilities" if len(missing_capabilities) > 1 else "capability"
         if dry_run:
-            print(f"Would have updated group {updated_toolkit_group.name} with {len(adding)} new {capability_str}.")
+            print(
+                f"Would have updated group {updated_toolkit_group.name} with {len(missing_capabilities)} new {capability_str}."
+            )
             return False
 
         try:
@@ -406,7 +422,9 @@ class AuthCommand(ToolkitCommand):
                 f"It is recommended that you manually delete the Group with ID {existing_group.id},"
                 f"such that you don't have a duplicated group in your CDF project."
             )
-        print(f"  [bold green]OK[/] - Updated the group {created.name} with {len(adding)} new {capability_str}.")
+        print(
+            f"  [bold green]OK[/] - Updated the group {created.name} with {len(missing_capabilities)} new {capability_str}."
+        )
         return True
 
     @staticmethod
@@ -438,15 +456,17 @@ class AuthCommand(ToolkitCommand):
         loaders_by_capability_tuple: dict[tuple, list[str]] = defaultdict(list)
         capability_by_id: dict[frozenset[tuple], Capability] = {}
         for loader_cls in loaders.RESOURCE_LOADER_LIST:
-            loader = loader_cls.create_loader(client)
+            # The display name is an instance property, which some loaders compute from their configuration.
+            display_name = loader_cls.create_loader(client).display_name
             capability = loader_cls.get_required_capability(None, read_only=False)
             capabilities = capability if isinstance(capability, list) else [capability]
             for cap in capabilities:
-                id_ = frozenset(cap.as_tuples())
+                cap_tuples = cap.as_tuples()
+                id_ = frozenset(cap_tuples)
                 if id_ not in capability_by_id:
                     capability_by_id[id_] = cap
-                for cap_tuple in cap.as_tuples():
-                    loaders_by_capability_tuple[cap_tuple].append(loader.display_name)
+                for cap_tuple in cap_tuples:
+                    loaders_by_capability_tuple[cap_tuple].append(display_name)
         return list(capability_by_id.values()), loaders_by_capability_tuple
 
     def check_has_any_access(self, client: ToolkitClient) -> TokenInspection:
@@ -477,7 +497,7 @@ class AuthCommand(ToolkitCommand):
                 "The service principal/application configured for this client does not have access to any projects."
             )
         print("\n".join(f"  - {p.url_name}" for p in token_inspection.projects))
-        if cdf_project not in {p.url_name for p in token_inspection.projects}:
+        if not any(p.url_name == cdf_project for p in token_inspection.projects):
             raise AuthorizationError(
                 f"The service principal/application configured for this client does not have access to the CDF_PROJECT={cdf_project!r}."
             )
@@ -531,14 +551,15 @@ class AuthCommand(ToolkitCommand):
         print("Checking identity provider settings...")
         project_info = client.get(f"/api/v1/projects/{cdf_project}").json()
         oidc = project_info.get("oidcConfiguration", {})
-        if "https://login.windows.net" in oidc.get("tokenUrl"):
-            tenant_id = oidc.get("tokenUrl").split("/")[-3]
+        token_url = oidc.get("tokenUrl") or ""
+        if "https://login.windows.net" in token_url:
+            tenant_id = token_url.split("/")[-3]
             print(f"  [bold green]OK[/]: Microsoft Entra ID (aka ActiveDirectory) with tenant id ({tenant_id}).")
-        elif "auth0.com" in oidc.get("tokenUrl"):
-            tenant_id = oidc.get("tokenUrl").split("/")[2].split(".")[0]
+        elif "auth0.com" in token_url:
+            tenant_id = token_url.split("/")[2].split(".")[0]
             print(f"  [bold green]OK[/] - Auth0 with tenant id ({tenant_id}).")
         else:
-            self.warn(MediumSeverityWarning(f"Unknown identity provider {oidc.get('tokenUrl')}"))
+            self.warn(MediumSeverityWarning(f"Unknown identity provider {token_url}"))
         access_claims = [c.get("claimName") for c in oidc.get("accessClaims", {})]
         print(
             f"  Matching on CDF group sourceIds will be done on any of these claims from the identity provider: {access_claims}"
@@ -585,9 +606,9 @@ class AuthCommand(ToolkitCommand):
                 )
             )
 
-    def check_duplicated_names(self, all_groups: GroupList, cdf_toolkit_group: Group) -> GroupList:
+    def check_duplicated_names(self, groups: Sequence[Group], cdf_toolkit_group: Group) -> GroupList:
         extra = GroupList(
-            [group for group in all_groups if group.name == cdf_toolkit_group.name and group.id != cdf_toolkit_group.id]
+            [group for group in groups if group.name == cdf_toolkit_group.name and group.id != cdf_toolkit_group.id]
         )
         if extra:
             self.warn(
@@ -602,16 +623,18 @@ class AuthCommand(ToolkitCommand):
         return extra
 
     @staticmethod
-    def _merge_capabilities(capability_list: list[Capability]) -> list[Capability]:
+    def _merge_capabilities(capability_list: Iterable[Capability]) -> list[Capability]:
         """Merges capabilities that have the same ACL and Scope"""
-        actions_by_scope_and_cls: dict[tuple[type[Capability], Capability.Scope], set[Capability.Action]] = defaultdict(
-            set
-        )
+        scope_by_key: dict[tuple[type[Capability], str], Capability.Scope] = {}
+        actions_by_key: dict[tuple[type[Capability], str], set[Capability.Action]] = defaultdict(set)
         for capability in capability_list:
-            actions_by_scope_and_cls[(type(capability), capability.scope)].update(capability.actions)
+            # Scopes with ids hold lists and are thus not hashable, so we key on the serialized scope.
+            key = (type(capability), json.dumps(capability.scope.dump(), sort_keys=True))
+            scope_by_key.setdefault(key, capability.scope)
+            actions_by_key[key].update(capability.actions)
         return [
-            cap_cls(actions=list(actions), scope=scope, allow_unknown=False)
-            for (cap_cls, scope), actions in actions_by_scope_and_cls.items()
+            cap_cls(actions=list(actions), scope=scope_by_key[(cap_cls, scope_key)], allow_unknown=False)
+            for (cap_cls, scope_key), actions in actions_by_key.items()
         ]
 
     def check_function_service_status(
@@ -666,14 +689,17 @@ class AuthCommand(ToolkitCommand):
         self, client: ToolkitClient, actions: list[FunctionsAcl.Action], has_added_capabilities: bool
     ) -> bool:
         t0 = time.perf_counter()
+        delay = 0.1
         while not (
             has_function_access := not client.iam.verify_capabilities(
                 FunctionsAcl(actions, FunctionsAcl.Scope.All()),
             )
         ):
             if has_added_capabilities and (time.perf_counter() - t0 < 5.0):
-                # Wait for the IAM service to update the capabilities
-                sleep(1.0)
+                # Wait for the IAM service to update the capabilities. This is often quick,
+                # so we start with a short wait and back off.
+                sleep(delay)
+                delay = min(delay * 2, 1.0)
             else:
                 break
         return has_function_access
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 import re
 from collections import defaultdict
 from collections.abc import Hashable, Iterable, Sequence
@@ -12,6 +13,7 @@ from rich import print
 from rich.panel import Panel
 from rich.progress import track
 
+from cognite_toolkit._cdf_tk._parameters import ParameterSpecSet
 from cognite_toolkit._cdf_tk.builders import Builder, create_builder
 from cognite_toolkit._cdf_tk.cdf_toml import CDFToml
 from cognite_toolkit._cdf_tk.client import ToolkitClient
@@ -92,6 +94,8 @@ from cognite_toolkit._cdf_tk.validation import (
 )
 from cognite_toolkit._version import __version__
 
+_UNRESOLVED_VARIABLE_PATTERN = re.compile(r"\{\{.*?\}\}")
+
 
 class BuildCommand(ToolkitCommand):
     def __init__(self, print_warning: bool = True, skip_tracking: bool = False, silent: bool = False) -> None:
@@ -106,6 +110,9 @@ class BuildCommand(ToolkitCommand):
         self._dependencies_by_required: dict[tuple[type[ResourceLoader], Hashable], list[tuple[Hashable, Path]]] = (
             defaultdict(list)
         )
+        self._source_by_path: dict[Path, tuple[str, SourceLocationEager]] = {}
+        self._seen_yaml_content_hashes: set[int] = set()
+        self._loaded_yaml_by_content: dict[str, dict[str, Any] | list[dict[str, Any]]] = {}
         self._has_built = False
         self._printed_variable_tree_structure_hint = False
 
@@ -224,10 +231,17 @@ class BuildCommand(ToolkitCommand):
         # Setup state before building modules
         self._module_names_by_variable_key.clear()
         self._builder_by_resource_folder.clear()
+        # A variable defined in a section applies to all modules at or below that section.
+        module_names_by_location: dict[Path, list[str]] = defaultdict(list)
+        for module_location in modules:
+            for location in (module_location.relative_path, *module_location.relative_path.parents):
+                module_names_by_location[location].append(module_location.name)
         for variable in variables:
-            for module_location in modules:
-                if variable.location in module_location.relative_path.parts:
-                    self._module_names_by_variable_key[variable.key].append(module_location.name)
+            if module_names := module_names_by_location.get(variable.location):
+                self._module_names_by_variable_key[variable.key].extend(module_names)
+        # A key defined in both a section and one of its sub-sections maps to the modules below the sub-section twice.
+        for key, module_names in self._module_names_by_variable_key.items():
+            self._module_names_by_variable_key[key] = list(dict.fromkeys(module_names))
         if self._has_built:
             # Todo: Reset of state??
             raise RuntimeError("In the build command, the `build_config` method should only be called once.")
@@ -466,13 +480,10 @@ class BuildCommand(ToolkitCommand):
             if verbose:
                 self.console(f"Processing file {source_path.name}...")
 
-            content = safe_read(source_path)
-            # We cannot use the content as the basis for hash as this have been encoded.
-            # Instead, we use the source path, which will hash the bytes of the file directly,
-            # which is what we do in the deploy step to verify that the source file has not changed.
-            source = SourceLocationEager(source_path, calculate_str_or_file_hash(source_path, shorten=True))
+            content, source = self._read_source(source_path)
 
-            content = variables.replace(content, source_path.suffix)
+            if "{{" in content:
+                content = variables.replace(content, source_path.suffix)
 
             replace_warnings = self._check_variables_replaced(content, module_dir, source_path)
 
@@ -494,7 +505,7 @@ class BuildCommand(ToolkitCommand):
                 # This is required by ExtractionPipelineConfig
                 content = stringify_value_by_key_in_yaml(content, key="config")
             try:
-                loaded = read_yaml_content(content)
+                loaded = self._read_yaml_content_cached(content)
             except yaml.YAMLError as e:
                 message = (
                     f"YAML validation error for {source_path.as_posix()!r} after substituting config variables:\n{e}"
@@ -515,12 +526,39 @@ class BuildCommand(ToolkitCommand):
 
         return source_files
 
+    def _read_source(self, source_path: Path) -> tuple[str, SourceLocationEager]:
+        # Modules used as templates read the same source files once per variable set.
+        if (cached := self._source_by_path.get(source_path)) is None:
+            # We cannot use the content as the basis for hash as this have been encoded.
+            # Instead, we use the source path, which will hash the bytes of the file directly,
+            # which is what we do in the deploy step to verify that the source file has not changed.
+            source = SourceLocationEager(source_path, calculate_str_or_file_hash(source_path, shorten=True))
+            cached = self._source_by_path[source_path] = safe_read(source_path), source
+        return cached
+
+    def _read_yaml_content_cached(self, content: str) -> dict[str, Any] | list[dict[str, Any]]:
+        # Modules used as templates are built once per variable set, and files without variables
+        # then have identical content in every iteration.
+        if (loaded := self._loaded_yaml_by_content.get(content)) is not None:
+            # The builders modify the loaded content, so each source file gets its own copy.
+            return copy.deepcopy(loaded)
+        content_hash = hash(content)
+        if content_hash not in self._seen_yaml_content_hashes:
+            # Most content is only read once, so we only keep the parsed result when content repeats.
+            self._seen_yaml_content_hashes.add(content_hash)
+            return read_yaml_content(content)
+        loaded = self._loaded_yaml_by_content[content] = read_yaml_content(content)
+        return copy.deepcopy(loaded)
+
     def _check_variables_replaced(self, content: str, module: Path, source_path: Path) -> WarningList[FileReadWarning]:
-        all_unmatched = re.findall(pattern=r"\{\{.*?\}\}", string=content)
         warning_list = WarningList[FileReadWarning]()
+        if "{{" not in content:
+            # All variables are replaced, which is the common case.
+            return warning_list
+        all_unmatched = _UNRESOLVED_VARIABLE_PATTERN.findall(content)
         for unmatched in all_unmatched:
             warning_list.append(UnresolvedVariableWarning(source_path, unmatched))
-            variable = unmatched[2:-2]
+            variable = unmatched[2:-2].strip()
             if module_names := self._module_names_by_variable_key.get(variable):
                 module_str = (
                     f"{module_names[0]!r}"
@@ -545,38 +583,56 @@ class BuildCommand(ToolkitCommand):
     def _check_missing_dependencies(self, project_config_dir: Path, client: ToolkitClient | None = None) -> None:
         existing = {(resource_cls, id_) for resource_cls, ids in self._ids_by_resource_type.items() for id_ in ids}
         missing_dependencies = set(self._dependencies_by_required.keys()) - existing
+        ids_by_loader: dict[type[ResourceLoader], list[Hashable]] = defaultdict(list)
         for loader_cls, id_ in missing_dependencies:
             if self._is_system_resource(loader_cls, id_):
                 continue
             elif loader_cls is DataSetsLoader and id_ == "":
                 # Special case used by the location filter to indicate filter out all classical resources.
                 continue
-            elif client and self._check_resource_exists_in_cdf(client, loader_cls, id_):
-                continue
             elif loader_cls.resource_cls is RawDatabase:
                 # Raw Databases are automatically created when a Raw Table is created.
                 continue
-            required_by = {
-                (required, path.relative_to(project_config_dir))
-                for required, path in self._dependencies_by_required[(loader_cls, id_)]
-            }
-            self.warn(MissingDependencyWarning(loader_cls.resource_cls.__name__, id_, required_by))
-
-    def _check_resource_exists_in_cdf(
-        self, client: ToolkitClient, loader_cls: type[ResourceLoader], id_: Hashable
-    ) -> bool:
-        """Check is the resource exists in the CDF project. If there are any issues assume it does not exist."""
-        if id_ in self.existing_resources_by_loader[loader_cls]:
-            return True
-        with contextlib.suppress(Exception):
-            if loader_cls not in self.instantiated_loaders:
-                self.instantiated_loaders[loader_cls] = loader_cls(client, None)
-            loader = self.instantiated_loaders[loader_cls]
-            retrieved = loader.retrieve([id_])
-            if retrieved:
-                self.existing_resources_by_loader[loader_cls].add(id_)
-                return True
-        return False
+            ids_by_loader[loader_cls].append(id_)
+
+        for loader_cls, ids in ids_by_loader.items():
+            if client:
+                self._lookup_resources_in_cdf(client, loader_cls, ids)
+            existing_in_cdf = self.existing_resources_by_loader[loader_cls]
+            for id_ in ids:
+                if id_ in existing_in_cdf:
+                    continue
+                required_by = {
+                    (required, path.relative_to(project_config_dir))
+                    for required, path in self._dependencies_by_required[(loader_cls, id_)]
+                }
+                self.warn(MissingDependencyWarning(loader_cls.resource_cls.__name__, id_, required_by))
+
+    def _lookup_resources_in_cdf(
+        self, client: ToolkitClient, loader_cls: type[ResourceLoader], ids: list[Hashable]
+    ) -> None:
+        """Records which of the resources exist in the CDF project. If there are any issues assume they do not exist."""
+        existing = self.existing_resources_by_loader[loader_cls]
+        to_lookup = [id_ for id_ in ids if id_ not in existing]
+        if not to_lookup:
+            return
+        if (loader := self.instantiated_loaders.get(loader_cls)) is None:
+            try:
+                loader = self.instantiated_loaders[loader_cls] = loader_cls(client, None)
+            except Exception:
+                return
+        if len(to_lookup) > 1:
+            try:
+                # One request for all the ids of the loader. Ids missing from the response do not exist.
+                existing.update(loader.get_ids(loader.retrieve(to_lookup)))
+                return
+            except Exception:
+                # Some loaders raise on unknown ids, so the ids are looked up one by one.
+                pass
+        for id_ in to_lookup:
+            with contextlib.suppress(Exception):
+                if loader.retrieve([id_]):
+                    existing.add(id_)
 
     def check_built_resource(
         self,
@@ -590,6 +646,8 @@ class BuildCommand(ToolkitCommand):
         items = [parsed] if isinstance(parsed, dict) else parsed
 
         identifier_kind_pairs: list[tuple[Hashable, str]] = []
+        # The spec only depends on the loader, and a file can have both raw databases and tables.
+        api_spec_by_loader: dict[type[ResourceLoader], ParameterSpecSet | None] = {}
         for no, item in enumerate(items, 1):
             element_no = None if is_dict_item else no
 
@@ -612,7 +670,8 @@ class BuildCommand(ToolkitCommand):
 
             if identifier:
                 identifier_kind_pairs.append((identifier, item_loader.kind))
-                if first_seen := self._ids_by_resource_type[item_loader].get(identifier):
+                source_by_id = self._ids_by_resource_type[item_loader]
+                if first_seen := source_by_id.get(identifier):
                     if isinstance(identifier, RawDatabase):
                         # RawDatabases are picked up from both RawTables and RawDatabases files. Note it is not possible
                         # to define a raw table without also defining the raw database. Thus, it is impossible to
@@ -621,7 +680,7 @@ class BuildCommand(ToolkitCommand):
                     if first_seen.hash != source.hash:
                         warning_list.append(DuplicatedItemWarning(source.path, identifier, first_seen.path))
                 else:
-                    self._ids_by_resource_type[item_loader][identifier] = source
+                    source_by_id[identifier] = source
 
                 try:
                     dependencies = list(item_loader.get_dependent_items(item))
@@ -634,20 +693,24 @@ class BuildCommand(ToolkitCommand):
                         f"Error in {source.path.as_posix()}{location}. "
                         f"Failed to extract dependencies from {item_loader.kind}."
                     )
+                dependent = (identifier, source.path)
                 for dependency in dependencies:
-                    self._dependencies_by_required[dependency].append((identifier, source.path))
+                    self._dependencies_by_required[dependency].append(dependent)
 
-            api_spec = item_loader.safe_get_write_cls_parameter_spec()
+            if item_loader not in api_spec_by_loader:
+                api_spec_by_loader[item_loader] = item_loader.safe_get_write_cls_parameter_spec()
+            api_spec = api_spec_by_loader[item_loader]
             if api_spec is not None:
                 resource_warnings = validate_resource_yaml(parsed, api_spec, source.path, element_no)
                 warning_list.extend(resource_warnings)
 
-            data_set_warnings = validate_data_set_is_set(items, loader.resource_cls, source.path)
-            warning_list.extend(data_set_warnings)
-
             item_warnings = item_loader.check_item(item, filepath=source.path, element_no=element_no)
             warning_list.extend(item_warnings)
 
+        # This validates all items at once, so it must not be called per item.
+        data_set_warnings = validate_data_set_is_set(items, loader.resource_cls, source.path)
+        warning_list.extend(data_set_warnings)
+
         return warning_list, identifier_kind_pairs
 
     @staticmethod
@@ -168,30 +168,41 @@ class BuildVariables(tuple, Sequence[BuildVariable]):
         self, content: str, file_suffix: str = ".yaml", use_placeholder: bool = False
     ) -> str | tuple[str, dict[str, BuildVariable]]:
         variable_by_placeholder: dict[str, BuildVariable] = {}
+        replace_by_key: dict[str, Any] = {}
         for variable in self:
             if not use_placeholder:
                 replace = variable.value_variable
             else:
                 replace = f"VARIABLE_{uuid.uuid4().hex[:8]}"
                 variable_by_placeholder[replace] = variable
-
-            _core_pattern = rf"{{{{\s*{variable.key}\s*}}}}"
-            if file_suffix in {".yaml", ".yml", ".json"}:
-                # Preserve data types
-                pattern = _core_pattern
-                if isinstance(replace, str) and (replace.isdigit() or replace.endswith(":")):
-                    replace = f'"{replace}"'
-                    pattern = rf"'{_core_pattern}'|{_core_pattern}|" + rf'"{_core_pattern}"'
-                elif replace is None:
-                    replace = "null"
-                content = re.sub(pattern, str(replace), content)
-            else:
-                content = re.sub(_core_pattern, str(replace), content)
+            # The first variable with a given key wins.
+            replace_by_key.setdefault(variable.key, replace)
+
+        # Preserve data types
+        preserve_type = file_suffix in {".yaml", ".yml", ".json"}
+
+        def _replace(match: re.Match[str]) -> str:
+            quote, replace = match.group("quote"), replace_by_key[match.group("key")]
+            if preserve_type and isinstance(replace, str) and (replace.isdigit() or replace.endswith(":")):
+                # The surrounding quotes, if any, are replaced by double quotes.
+                return f'"{replace}"'
+            elif preserve_type and replace is None:
+                replace = "null"
+            return f"{quote}{replace}{quote}"
+
+        if replace_by_key:
+            # All variables are substituted in a single pass over the content.
+            content = self._replace_pattern.sub(_replace, content)
         if use_placeholder:
             return content, variable_by_placeholder
         else:
             return content
 
+    @cached_property
+    def _replace_pattern(self) -> re.Pattern[str]:
+        keys = "|".join(re.escape(key) for key in dict.fromkeys(variable.key for variable in self))
+        return re.compile(rf"(?P<quote>['\"]?)\{{\{{\s*(?P<key>{keys})\s*\}}\}}(?P=quote)")
+
     # Implemented to get correct type hints
     def __iter__(self) -> Iterator[BuildVariable]:
         return super().__iter__()
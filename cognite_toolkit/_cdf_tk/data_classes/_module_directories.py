@@ -79,9 +79,10 @@ class ModuleLocation:
         source_path_by_resource_folder, _ = self._source_paths_by_resource_folder
         return set(source_path_by_resource_folder.keys())
 
-    @property
+    @cached_property
     def _source_paths_by_resource_folder(self) -> tuple[dict[str, list[Path]], set[str]]:
         """The source paths grouped by resource folder."""
+        # Cached as this stats every source file and is used by several of the properties below.
         source_paths_by_resource_folder = defaultdict(list)
         # The directories in the module that are not resource directories.
         invalid_resource_directory: set[str] = set()
@@ -8,9 +8,9 @@ from typing import Any, ClassVar
 from cognite_toolkit._cdf_tk.exceptions import ToolkitFileExistsError
 
 if sys.version_info >= (3, 11):
-    import toml
+    import tomllib
 else:
-    import tomli as toml
+    import tomli as tomllib
 
 
 @dataclass(frozen=True)
@@ -48,7 +48,7 @@ class ModuleToml:
     @classmethod
     def load(cls, data: dict[str, Any] | Path) -> ModuleToml:
         if isinstance(data, Path):
-            return cls.load(toml.loads(data.read_text(encoding="utf-8")))
+            return cls.load(tomllib.loads(data.read_text(encoding="utf-8")))
 
         if "dependencies" in data:
             dependencies = frozenset(data["dependencies"].get("modules", set()))
@@ -10,9 +10,9 @@ from cognite_toolkit._cdf_tk.exceptions import ToolkitFileNotFoundError, Toolkit
 from ._module_directories import ModuleDirectories, ModuleLocation
 
 if sys.version_info >= (3, 11):
-    import toml
+    import tomllib
 else:
-    import tomli as toml
+    import tomli as tomllib
 
 
 @dataclass
@@ -69,7 +69,7 @@ class Packages(dict, MutableMapping[str, Package]):
         package_definition_path = root_module_dir / "package.toml"
         if not package_definition_path.exists():
             raise ToolkitFileNotFoundError(f"Package manifest toml not found at {package_definition_path}")
-        package_definitions = toml.loads(package_definition_path.read_text(encoding="utf-8"))["packages"]
+        package_definitions = tomllib.loads(package_definition_path.read_text(encoding="utf-8"))["packages"]
 
         collected: dict[str, Package] = {
             package_name: Package.load(package_name, package_definition)
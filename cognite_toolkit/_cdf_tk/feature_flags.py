@@ -37,6 +37,11 @@ class Flags(Enum):
         "description": "Stores a hash of the credentials of Workflow/Transformation/Function in the resources such that"
         " the resource is updated when the credentials change",
     }
+    UV_INSTALL: ClassVar[dict[str, Any]] = {  # type: ignore[misc]
+        "visible": True,
+        "description": "Installs the requirements of locally run functions with uv when it is on PATH. Note that uv"
+        " does not read the pip configuration, such as pip.conf and PIP_INDEX_URL",
+    }
 
     def is_enabled(self) -> bool:
         return FeatureFlag.is_enabled(self)
@@ -16,8 +16,6 @@ from .loaders import LOADER_BY_FOLDER_NAME
 from .tk_warnings import MediumSeverityWarning
 from .utils import find_directory_with_subdirectories
 
-CDF_TOML = CDFToml.load(Path.cwd())
-
 
 class Hint:
     _indent = " " * 5
@@ -73,7 +71,7 @@ def verify_module_directory(organization_dir: Path, build_env_name: str | None)
 
     config_file = BuildConfigYAML.get_filename(build_env_name or "MISSING")
 
-    has_config_yaml = CDF_TOML.cdf.has_user_set_default_env and build_env_name is not None
+    has_config_yaml = CDFToml.load().cdf.has_user_set_default_env and build_env_name is not None
     if organization_dir != Path.cwd():
         if has_config_yaml:
             content = f"  ┣ {MODULES}/\n  ┗ {config_file}\n"
@@ -185,6 +185,9 @@ class ResourceLoader(
     # This is used in the iterate method to ensure that nothing is returned if
     # the resource type does not have a parent resource.
     parent_resource: frozenset[type[ResourceLoader]] = frozenset()
+    # Whether iterate makes one request per parent id. If so, the parent ids can be split into chunks
+    # that are iterated in parallel. Loaders that filter or list all resources in one go should not set this.
+    iterate_per_parent_id = False
 
     # The methods that must be implemented in the subclass
     @classmethod
@@ -395,6 +395,7 @@ class SequenceRowLoader(
     kind = "SequenceRow"
     dependencies = frozenset({SequenceLoader})
     parent_resource = frozenset({SequenceLoader})
+    iterate_per_parent_id = True
     _doc_url = "Sequences/operation/postSequenceData"
     support_update = False
 
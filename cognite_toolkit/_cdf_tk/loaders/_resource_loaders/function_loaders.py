@@ -349,6 +349,7 @@ class FunctionScheduleLoader(
     dependencies = frozenset({FunctionLoader, GroupResourceScopedLoader, GroupAllScopedLoader})
     _doc_url = "Function-schedules/operation/postFunctionSchedules"
     parent_resource = frozenset({FunctionLoader})
+    iterate_per_parent_id = True
     support_update = False
 
     _hash_key = "cdf-auth"
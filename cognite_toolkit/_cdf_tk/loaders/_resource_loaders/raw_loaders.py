@@ -164,6 +164,7 @@ class RawTableLoader(ResourceContainerLoader[RawTable, RawTable, RawTable, RawTa
     dependencies = frozenset({RawDatabaseLoader, GroupAllScopedLoader})
     _doc_url = "Raw/operation/createTables"
     parent_resource = frozenset({RawDatabaseLoader})
+    iterate_per_parent_id = True
 
     def __init__(self, client: ToolkitClient, build_dir: Path, console: Console | None):
         super().__init__(client, build_dir, console)
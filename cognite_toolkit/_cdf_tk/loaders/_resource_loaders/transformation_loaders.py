@@ -444,6 +444,7 @@ class TransformationScheduleLoader(
     dependencies = frozenset({TransformationLoader})
     _doc_url = "Transformation-Schedules/operation/createTransformationSchedules"
     parent_resource = frozenset({TransformationLoader})
+    iterate_per_parent_id = True
 
     @property
     def display_name(self) -> str:
@@ -542,6 +543,7 @@ class TransformationNotificationLoader(
     _doc_url = "Transformation-Notifications/operation/createTransformationNotifications"
     _split_character = "@@@"
     parent_resource = frozenset({TransformationLoader})
+    iterate_per_parent_id = True
 
     @property
     def display_name(self) -> str:
@@ -106,14 +106,23 @@ def get_parameters(cls: Any) -> Any:
     return sign.replace(parameters=filtered_params).parameters.values()
 
 
+_LITERAL_PATTERN = re.compile(r"Literal\[(.*?)\]")
+_LIST_PATTERN = re.compile(r"list\[(.*?)\]")
+# Matches | that are not inside brackets, i.e., the top level union separators.
+_UNION_SEPARATOR_PATTERN = re.compile(r"\|(?![^\[\]]*\])")
+
+
 def unpack_annotations(str_annotations: str) -> Any:
     str_annotations = str_annotations.replace("Sequence[", "list[")
-    str_annotations = re.sub(r"Literal\[(.*?)\]", lambda match: match.group(1), str_annotations)
+    if "Literal[" in str_annotations:
+        str_annotations = _LITERAL_PATTERN.sub(lambda match: match.group(1), str_annotations)
 
-    pattern = r"\|(?![^\[\]]*\])"
-    annotations = [a.strip() for a in re.split(pattern, str_annotations)]
+    if "|" in str_annotations:
+        annotations = [a.strip() for a in _UNION_SEPARATOR_PATTERN.split(str_annotations)]
+    else:
+        annotations = [str_annotations.strip()]
 
-    if not any([a not in IGNORED_ANNOTATIONS for a in annotations]):
+    if all(a in IGNORED_ANNOTATIONS for a in annotations):
         return str_annotations
 
     cognite_classes = {name: obj for name, obj in inspect.getmembers(data_classes) if inspect.isclass(obj)}
@@ -123,7 +132,7 @@ def unpack_annotations(str_annotations: str) -> Any:
 
     for annotation in annotations:
         if annotation.startswith("list["):
-            return [unpack_annotations(re.sub(r"list\[(.*?)\]", lambda match: match.group(1), annotation))]
+            return [unpack_annotations(_LIST_PATTERN.sub(lambda match: match.group(1), annotation))]
         else:
             cls = cognite_classes.get(annotation)
             if not cls:
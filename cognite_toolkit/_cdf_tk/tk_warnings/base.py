@@ -97,7 +97,10 @@ class WarningList(UserList, Generic[T_Warning]):
 
     def __str__(self) -> str:
         output = [""]
-        for group_key, group in itertools.groupby(sorted(self), key=lambda w: w.group_key()):
+        # Sorting by key computes the (deep copied) tuple once per warning, instead of twice per comparison.
+        for group_key, group in itertools.groupby(
+            sorted(self, key=lambda w: w.as_tuple()), key=lambda w: w.group_key()
+        ):
             group_list = list(group)
             header = group_list[0].group_header()
             if header:
@@ -215,6 +215,9 @@ def yaml_safe_dump(data: Any, sort_keys: bool = False, indent: int | None = None
 
 def quote_int_value_by_key_in_yaml(content: str, key: str) -> str:
     """Quote a value in a yaml string"""
+    if f"{key}:" not in content:
+        # Cheap check to skip the regex scan of every line for files without the key.
+        return content
     # This pattern will match the key if it is not already quoted
     pattern = rf"^(\s*-?\s*)?{key}:\s*(?!.*['\":])([\d_]+)$"
     replacement = rf'\1{key}: "\2"'
@@ -224,6 +227,8 @@ def quote_int_value_by_key_in_yaml(content: str, key: str) -> str:
 
 def stringify_value_by_key_in_yaml(content: str, key: str) -> str:
     """Quote a value in a yaml string"""
+    if f"{key}:" not in content:
+        return content
     pattern = rf"^{key}:\s*$"
     replacement = rf"{key}: |"
     return re.sub(pattern, replacement, content, flags=re.MULTILINE)
@@ -1,4 +1,5 @@
 import itertools
+import os
 from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Literal, overload
@@ -39,14 +40,24 @@ def _iterate_modules(root_dir: Path) -> Iterator[tuple[Path, list[Path]]]:
 
     if not root_dir.exists():
         return
-    for module_dir in root_dir.iterdir():
-        if not module_dir.is_dir():
-            continue
-        sub_directories = [path for path in module_dir.iterdir() if path.is_dir()]
-        is_any_resource_directories = any(dir.name in LOADER_BY_FOLDER_NAME for dir in sub_directories)
-        if sub_directories and is_any_resource_directories:
+    # Using os.scandir and os.walk as the directory entries know whether they are files or directories,
+    # which saves a stat call per path compared to Path.iterdir and Path.rglob.
+    with os.scandir(root_dir) as entries:
+        module_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    for module_dir in module_dirs:
+        with os.scandir(module_dir) as entries:
+            sub_directory_names = [entry.name for entry in entries if entry.is_dir()]
+        if any(name in LOADER_BY_FOLDER_NAME for name in sub_directory_names):
             # Module found
-            yield module_dir, [path for path in module_dir.rglob("*") if path.is_file() and path.name not in EXCL_FILES]
+            yield (
+                module_dir,
+                [
+                    Path(directory, filename)
+                    for directory, _, filenames in os.walk(module_dir)
+                    for filename in filenames
+                    if filename not in EXCL_FILES
+                ],
+            )
             # Stop searching for modules in subdirectories
             continue
         yield from _iterate_modules(module_dir)
@@ -7,6 +7,7 @@ import pytest
 
 from cognite_toolkit._cdf_tk.builders import get_loader
 from cognite_toolkit._cdf_tk.loaders import FileLoader, RawDatabaseLoader, RawTableLoader, ResourceLoader
+from cognite_toolkit._cdf_tk.tk_warnings.fileread import UnknownResourceTypeWarning
 
 
 @pytest.mark.parametrize(
@@ -34,3 +35,35 @@ def test_get_loader_file() -> None:
 
     assert warning is None
     assert loader_cls is FileLoader
+
+
+@pytest.mark.parametrize(
+    "filename, resource_folder, expected_suggestion",
+    [
+        pytest.param(
+            "my_timeseries.TimeSerie.yaml",
+            "timeseries",
+            "Did you mean to call the file 'my_timeseries.TimeSeries.yaml'?",
+            id="Misspelled kind",
+        ),
+        pytest.param(
+            "my_data.yaml",
+            "data_sets",
+            "Did you mean to call the file 'my_data.DataSet.yaml'?",
+            id="Missing kind single loader",
+        ),
+        pytest.param(
+            "my_etl.yaml",
+            "transformations",
+            "All files in the 'transformations' folder must have a file extension that matches the resource type. "
+            "Supported types are: Notification, Schedule and Transformation.",
+            id="Missing kind multiple loaders",
+        ),
+    ],
+)
+def test_get_loader_unknown_kind_suggestion(filename: str, resource_folder: str, expected_suggestion: str) -> None:
+    loader, warning = get_loader(Path(filename), resource_folder)
+
+    assert loader is None
+    assert isinstance(warning, UnknownResourceTypeWarning)
+    assert warning.suggestion == expected_suggestion
@@ -0,0 +1,38 @@
+import pytest
+from cognite.client.credentials import Token
+
+from cognite_toolkit._cdf_tk.client import ToolkitClientConfig
+
+
+def _create_config(base_url: str) -> ToolkitClientConfig:
+    return ToolkitClientConfig(client_name="test", project="my_project", credentials=Token("abc"), base_url=base_url)
+
+
+class TestToolkitClientConfig:
+    @pytest.mark.parametrize(
+        "base_url, expected",
+        [
+            pytest.param("https://az-eastus-1.cognitedata.com", "azure", id="Azure prefix"),
+            pytest.param("https://bluefield.cognitedata.com", "azure", id="Azure named cluster"),
+            pytest.param("https://aws-dub-dev.cognitedata.com", "aws", id="AWS prefix"),
+            pytest.param("https://orangefield.cognitedata.com", "aws", id="AWS named cluster"),
+            pytest.param("https://gc-dub-dev.cognitedata.com", "gcp", id="GCP prefix"),
+            pytest.param("https://greenfield.cognitedata.com", "gcp", id="GCP named cluster"),
+            pytest.param("https://my-cluster.cognitedata.com", "unknown", id="Unknown cluster"),
+            pytest.param("https://example.com", "unknown", id="Not a CDF url"),
+        ],
+    )
+    def test_cloud_provider(self, base_url: str, expected: str) -> None:
+        assert _create_config(base_url).cloud_provider == expected
+
+    @pytest.mark.parametrize(
+        "base_url, expected",
+        [
+            pytest.param("https://plink.westeurope-1.cognitedata.com", True, id="Private link"),
+            pytest.param("https://westeurope-1.plink.cognitedata.com", True, id="Private link subdomain"),
+            pytest.param("https://westeurope-1.cognitedata.com", False, id="Public cluster"),
+            pytest.param("https://plink.example.com", False, id="Not a CDF url"),
+        ],
+    )
+    def test_is_private_link(self, base_url: str, expected: bool) -> None:
+        assert _create_config(base_url).is_private_link is expected
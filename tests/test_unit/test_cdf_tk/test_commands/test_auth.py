@@ -11,8 +11,10 @@ from cognite.client.data_classes._base import CogniteResource, CogniteResourceLi
 from cognite.client.data_classes.capabilities import (
     AllProjectsScope,
     Capability,
+    DataSetScope,
     ProjectCapability,
     ProjectCapabilityList,
+    TimeSeriesAcl,
 )
 from cognite.client.data_classes.iam import Group, GroupList, ProjectSpec, TokenInspection
 
@@ -162,3 +164,19 @@ class TestAuthCommand:
             "Unable to continue, the service principal/application configured for this "
             "client does not have the basic read group access rights."
         )
+
+
+class TestMergeCapabilities:
+    def test_merge_capabilities_with_id_scopes(self) -> None:
+        capabilities = [
+            TimeSeriesAcl([TimeSeriesAcl.Action.Read], DataSetScope([1, 2])),
+            TimeSeriesAcl([TimeSeriesAcl.Action.Write], DataSetScope([1, 2])),
+            TimeSeriesAcl([TimeSeriesAcl.Action.Read], DataSetScope([3])),
+        ]
+
+        merged = AuthCommand._merge_capabilities(capabilities)
+
+        assert len(merged) == 2
+        assert set(merged[0].actions) == {TimeSeriesAcl.Action.Read, TimeSeriesAcl.Action.Write}
+        assert merged[0].scope == DataSetScope([1, 2])
+        assert merged[1].scope == DataSetScope([3])
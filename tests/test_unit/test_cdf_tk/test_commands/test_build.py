@@ -4,8 +4,10 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+import yaml
 from _pytest.monkeypatch import MonkeyPatch
 from cognite.client.data_classes.data_modeling import DataModelId
+from cognite.client.exceptions import CogniteAPIError
 
 from cognite_toolkit._cdf_tk.commands.build import BuildCommand
 from cognite_toolkit._cdf_tk.data_classes import BuildVariables, Environment
@@ -60,6 +62,48 @@ class TestBuildCommand:
             in cmd.warning_list
         )
 
+    def test_unresolved_variable_hint_names_defining_modules(self, tmp_path: Path) -> None:
+        organization_dir = tmp_path / "org"
+        (organization_dir / "modules").mkdir(parents=True)
+        (organization_dir / "config.dev.yaml").write_text(
+            yaml.safe_dump(
+                {
+                    "environment": {
+                        "name": "dev",
+                        "project": "my_project",
+                        "validation-type": "dev",
+                        "selected": ["modules/"],
+                    },
+                    # The variable is defined in both a section and its sub-section, but not for module_b.
+                    "variables": {
+                        "modules": {
+                            "section": {"dataset": "section_dataset", "module_a": {"dataset": "module_a_dataset"}}
+                        }
+                    },
+                }
+            )
+        )
+        for module in ["section/module_a", "module_b"]:
+            data_set_dir = organization_dir / "modules" / module / "data_sets"
+            data_set_dir.mkdir(parents=True)
+            (data_set_dir / "my.DataSet.yaml").write_text("externalId: '{{ dataset }}'\nname: My data set\n")
+        cmd = BuildCommand(print_warning=False)
+        cmd.console = MagicMock()  # type: ignore[method-assign]
+
+        cmd.execute(
+            verbose=False,
+            build_dir=tmp_path / "build",
+            organization_dir=organization_dir,
+            selected=None,
+            build_env_name="dev",
+            no_clean=False,
+        )
+
+        hints = [call.args[0] for call in cmd.console.call_args_list if "Hint" in call.kwargs.get("prefix", "")]
+        assert len(hints) == 1
+        assert "The variable 'dataset' is defined in the variable section 'module_a'." in hints[0]
+        assert f"the location of {(organization_dir / 'modules' / 'module_b').as_posix()}" in hints[0]
+
     @pytest.mark.skipif(not Flags.GRAPHQL.is_enabled(), reason="GraphQL schema files will give warnings")
     def test_custom_project_no_warnings(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
         cmd = BuildCommand(print_warning=False)
@@ -82,6 +126,48 @@ class TestBuildCommand:
         ]
         assert len(transformation_files) == 2
 
+    def test_lookup_resources_in_cdf_falls_back_to_single_retrieve(self) -> None:
+        cmd = BuildCommand(silent=True)
+        loader = MagicMock()
+
+        def retrieve(ids: list[str]) -> list[str]:
+            if "missing" in ids:
+                raise CogniteAPIError("Not found", 400)
+            return ids
+
+        loader.retrieve.side_effect = retrieve
+        loader.get_ids.side_effect = lambda items: list(items)
+        loader_cls = MagicMock(return_value=loader)
+
+        cmd._lookup_resources_in_cdf(MagicMock(), loader_cls, ["existing", "missing"])
+
+        assert cmd.existing_resources_by_loader[loader_cls] == {"existing"}
+        assert loader.retrieve.call_count == 3
+
+    def test_lookup_resources_in_cdf_missing_ids_in_response(self) -> None:
+        cmd = BuildCommand(silent=True)
+        loader = MagicMock()
+        loader.retrieve.side_effect = lambda ids: [id_ for id_ in ids if id_ == "existing"]
+        loader.get_ids.side_effect = lambda items: list(items)
+        loader_cls = MagicMock(return_value=loader)
+
+        cmd._lookup_resources_in_cdf(MagicMock(), loader_cls, ["existing", "missing"])
+
+        assert cmd.existing_resources_by_loader[loader_cls] == {"existing"}
+        assert loader.retrieve.call_count == 1
+
+    def test_lookup_resources_in_cdf_single_request(self) -> None:
+        cmd = BuildCommand(silent=True)
+        loader = MagicMock()
+        loader.retrieve.side_effect = lambda ids: ids
+        loader.get_ids.side_effect = lambda items: list(items)
+        loader_cls = MagicMock(return_value=loader)
+
+        cmd._lookup_resources_in_cdf(MagicMock(), loader_cls, ["first", "second"])
+
+        assert cmd.existing_resources_by_loader[loader_cls] == {"first", "second"}
+        loader.retrieve.assert_called_once_with(["first", "second"])
+
 
 class TestCheckYamlSemantics:
     def test_build_valid_read_int_version(self) -> None:
@@ -109,3 +195,17 @@ externalId: some_external_id
         assert isinstance(source_file.loaded, dict)
         actual = DataModelId.load(source_file.loaded["destination"]["dataModel"])
         assert actual == DataModelId("my_space", "MyModel", "1_0_0")
+
+    def test_read_yaml_content_cached_returns_copies(self) -> None:
+        cmd = BuildCommand(silent=True)
+        content = "externalId: my_transformation\nqueryFile: query.sql\n"
+
+        first = cmd._read_yaml_content_cached(content)
+        assert not cmd._loaded_yaml_by_content, "Content seen once should not be cached"
+        first["queryFile"] = "changed.sql"
+        second = cmd._read_yaml_content_cached(content)
+        second["queryFile"] = "changed.sql"
+        third = cmd._read_yaml_content_cached(content)
+
+        assert third == {"externalId": "my_transformation", "queryFile": "query.sql"}
+        assert len(cmd._loaded_yaml_by_content) == 1
@@ -0,0 +1,137 @@
+import itertools
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from typing import Any, ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from cognite_toolkit._cdf_tk.commands._purge import PurgeCommand, _iterate_in_background
+
+
+class TestIterateInBackground:
+    def test_iterates_all_items_in_order(self) -> None:
+        assert list(_iterate_in_background(range(10), max_prefetch=2)) == list(range(10))
+
+    def test_error_in_iterable_is_raised_to_consumer(self) -> None:
+        def failing() -> Iterator[int]:
+            yield 1
+            yield 2
+            raise ValueError("Failed to retrieve the next batch")
+
+        received: list[int] = []
+        with pytest.raises(ValueError, match="Failed to retrieve the next batch"):
+            for item in _iterate_in_background(failing(), max_prefetch=2):
+                received.append(item)
+
+        assert received == [1, 2]
+
+    def test_producer_thread_exits_when_consumer_stops(self) -> None:
+        producer_threads: list[threading.Thread] = []
+
+        def endless() -> Iterator[int]:
+            producer_threads.append(threading.current_thread())
+            yield from itertools.count()
+
+        iterator = _iterate_in_background(endless(), max_prefetch=2)
+        assert [next(iterator) for _ in range(3)] == [0, 1, 2]
+        iterator.close()
+
+        assert len(producer_threads) == 1
+        producer_threads[0].join(timeout=5)
+        assert not producer_threads[0].is_alive()
+
+    def test_max_prefetch_bounds_read_ahead(self) -> None:
+        produced: list[int] = []
+
+        def counting() -> Iterator[int]:
+            for no in range(100):
+                produced.append(no)
+                yield no
+
+        max_prefetch = 3
+        iterator = _iterate_in_background(counting(), max_prefetch=max_prefetch)
+        assert next(iterator) == 0
+        # Give the producer time to fill the buffer.
+        time.sleep(0.2)
+
+        # The consumed item, the buffered items, and the item the producer is waiting to put.
+        assert len(produced) <= 1 + max_prefetch + 1
+        assert list(iterator) == list(range(1, 100))
+
+
+class FakeChildLoader:
+    dependencies: ClassVar[frozenset[type]] = frozenset()
+    iterate_per_parent_id = False
+
+    def __init__(self, children_by_parent: dict[str, list[str]], delay: float = 0.0) -> None:
+        self.display_name = type(self).__name__
+        self.client = MagicMock()
+        self.client.config.max_workers = 4
+        self.children_by_parent = children_by_parent
+        self.delay = delay
+
+    def iterate(self, parent_ids: list[Hashable]) -> Iterator[str]:
+        time.sleep(self.delay)
+        for parent_id in parent_ids:
+            yield from self.children_by_parent.get(str(parent_id), [])
+
+    def get_id(self, item: Any) -> str:
+        return item
+
+    def delete(self, ids: list[str]) -> int:
+        return len(ids)
+
+
+class ParentLoader(FakeChildLoader): ...
+
+
+class DependentLoader(FakeChildLoader):
+    dependencies: ClassVar[frozenset[type]] = frozenset({ParentLoader})
+
+
+class FirstIndependentLoader(FakeChildLoader): ...
+
+
+class SecondIndependentLoader(FakeChildLoader): ...
+
+
+class TestPurgeCommand:
+    def test_group_independent_loaders(self) -> None:
+        dependent = DependentLoader({})
+        parent = ParentLoader({})
+        first = FirstIndependentLoader({})
+        second = SecondIndependentLoader({})
+
+        assert PurgeCommand._group_independent_loaders([dependent, parent]) == [[dependent], [parent]]
+        assert PurgeCommand._group_independent_loaders([first, second]) == [[first, second]]
+        assert PurgeCommand._group_independent_loaders([dependent, parent, first, second]) == [
+            [dependent],
+            [parent, first, second],
+        ]
+
+    def test_delete_children_returns_counts_in_loader_order(self) -> None:
+        child_loaders = [
+            DependentLoader({"a": ["dependent1"]}),
+            # The parent loader is deleted in parallel with the independent loaders, and finishes last.
+            ParentLoader({"a": ["parent1"], "b": ["parent2", "parent3"]}, delay=0.1),
+            FirstIndependentLoader({"b": ["first1", "first2"]}, delay=0.05),
+            SecondIndependentLoader({"a": ["second1"]}),
+        ]
+
+        counts = PurgeCommand._delete_children(
+            ["a", "b"],
+            child_loaders,  # type: ignore[arg-type]
+            dry_run=False,
+            console=Console(),
+            verbose=False,
+        )
+
+        assert list(counts.items()) == [
+            ("DependentLoader", 1),
+            ("ParentLoader", 3),
+            ("FirstIndependentLoader", 2),
+            ("SecondIndependentLoader", 1),
+        ]
@@ -0,0 +1,79 @@
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cognite_toolkit._cdf_tk.commands._virtual_env import FunctionVirtualEnvironment
+
+
+class TestFunctionVirtualEnvironment:
+    @pytest.mark.parametrize(
+        "uv_enabled, uv_path, expected_with_pip, expected_args",
+        [
+            pytest.param(
+                True,
+                "/usr/bin/uv",
+                False,
+                ["/usr/bin/uv", "pip", "install", "--python", "{env_exe}", "-r", "requirements.txt"],
+                id="uv enabled and installed",
+            ),
+            pytest.param(
+                True,
+                None,
+                True,
+                [
+                    "{pip}",
+                    "install",
+                    "--disable-pip-version-check",
+                    "--no-compile",
+                    "-r",
+                    "requirements.txt",
+                ],
+                id="uv enabled but not installed",
+            ),
+            pytest.param(
+                False,
+                "/usr/bin/uv",
+                True,
+                [
+                    "{pip}",
+                    "install",
+                    "--disable-pip-version-check",
+                    "--no-compile",
+                    "-r",
+                    "requirements.txt",
+                ],
+                id="uv installed but not enabled",
+            ),
+        ],
+    )
+    def test_install_requirements(
+        self,
+        uv_enabled: bool,
+        uv_path: str | None,
+        expected_with_pip: bool,
+        expected_args: list[str],
+        tmp_path: Path,
+    ) -> None:
+        context = SimpleNamespace(
+            env_dir=str(tmp_path / "venv"),
+            env_exe=str(tmp_path / "venv" / "bin" / "python"),
+            bin_path=str(tmp_path / "venv" / "bin"),
+        )
+        with (
+            patch("cognite_toolkit._cdf_tk.commands._virtual_env.Flags") as flags,
+            patch("cognite_toolkit._cdf_tk.commands._virtual_env.shutil.which", return_value=uv_path),
+            patch("cognite_toolkit._cdf_tk.commands._virtual_env.Popen") as popen,
+        ):
+            flags.UV_INSTALL.is_enabled.return_value = uv_enabled
+            popen.return_value = MagicMock(returncode=0)
+            env = FunctionVirtualEnvironment("cognite-sdk\n", rebuild=False)
+            env.post_setup(context)
+
+        assert env.with_pip is expected_with_pip
+        expected = [
+            arg.format(env_exe=context.env_exe, pip=str(Path(context.bin_path) / "pip")) for arg in expected_args
+        ]
+        assert popen.call_args.args[0] == expected
+        assert (tmp_path / "requirements.txt").read_text(encoding="utf-8") == "cognite-sdk\n"
@@ -101,6 +101,21 @@ query: >-
 
         assert loaded["query"] == 'select "fpso_uny" as externalId, "UNY" as uid, "UNY" as description'
 
+    def test_replace_value_with_backslash(self) -> None:
+        source_yaml = """path: '{{ my_path }}'\ndescription: {{my_description}}\n"""
+        variables = BuildVariables.load_raw(
+            {
+                "my_path": "C:\\data\\1",
+                "my_description": "Not {{ my_path }}",
+            },
+            available_modules=set(),
+            selected_modules=set(),
+        )
+
+        result = variables.replace(source_yaml, file_suffix=".yaml")
+
+        assert result == """path: 'C:\\data\\1'\ndescription: Not {{ my_path }}\n"""
+
     def test_get_module_variables_variable_preference_order(self) -> None:
         source_yaml = """
 modules:
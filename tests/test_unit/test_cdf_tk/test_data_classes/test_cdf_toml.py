@@ -1,6 +1,11 @@
+from pathlib import Path
+
+import pytest
+
 from cognite_toolkit import _version
-from cognite_toolkit._cdf_tk.cdf_toml import CDFToml
+from cognite_toolkit._cdf_tk.cdf_toml import CDFToml, CLIConfig
 from tests.constants import REPO_ROOT
+from tests.data import CDF_TOML_DATA
 
 
 class TestCDFToml:
@@ -8,3 +13,26 @@ class TestCDFToml:
         config = CDFToml.load(REPO_ROOT)
 
         assert config.modules.version == _version.__version__
+
+    def test_singleton_is_per_directory(self) -> None:
+        repo_config = CDFToml.load(REPO_ROOT)
+        data_config = CDFToml.load(CDF_TOML_DATA)
+
+        assert repo_config is not data_config
+        assert CDFToml.load(CDF_TOML_DATA) is data_config
+        assert data_config.plugins == {"graphql": True, "dumpassets": False, "unknown": False}
+
+
+class TestCLIConfig:
+    @pytest.mark.parametrize(
+        "organization_dir, expected",
+        [
+            pytest.param("my_org", Path("/project/my_org"), id="Relative to cdf.toml"),
+            pytest.param("/absolute/my_org", Path("/absolute/my_org"), id="Absolute"),
+        ],
+    )
+    def test_load_default_organization_dir(self, organization_dir: str, expected: Path) -> None:
+        config = CLIConfig.load({"default_organization_dir": organization_dir}, Path("/project"))
+
+        assert config.default_organization_dir == expected
+        assert config.has_user_set_default_org